@@ -1,58 +1,163 @@
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from concurrent.futures import ProcessPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
 import json
+try:
+    import orjson  # C-backed; several times faster than stdlib json
+except ImportError:
+    orjson = None
+import os
+import random
 import time
 import re
+import urllib.robotparser
 
 base_url = "https://www.iit.edu/directory/people"
 
+# Per-page results are checkpointed here so an interrupted crawl can be
+# re-run without refetching pages that already succeeded
+CACHE_DIR = '.cache'
+STATE_FILE = os.path.join(CACHE_DIR, 'state.json')
+
+# People stream to a JSON-lines file as pages complete, so peak memory
+# stays at one page's worth and downstream tooling can tail the file
+OUTPUT_JSONL = 'iit_people_complete.jsonl'
+
+def dumps_compact(obj):
+    """Compact one-line JSON string, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+def dump_json(obj, path):
+    """Pretty-printed JSON file, via orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+# Self-identifying UA so the site can see (and contact) who is crawling
+USER_AGENT = 'IIT-QA-Bot/0.1 (+https://github.com/Vismay-Archi/Q-A-Chatbot)'
+
 headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    'User-Agent': USER_AGENT
 }
 
+# robots.txt is fetched once per run and consulted before every page
+_RP = urllib.robotparser.RobotFileParser()
+_RP.set_url('https://www.iit.edu/robots.txt')
+
+def load_robots():
+    try:
+        _RP.read()
+    except Exception:
+        _RP.allow_all = True  # unreachable robots.txt shouldn't kill the run
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class AsyncRateLimiter:
+    """Token-bucket limiter shared across all fetches to one host.
+
+    Allows short bursts while the bucket has tokens, then falls back to
+    the steady `rate` per `period` seconds — unlike a flat sleep, a slow
+    response already 'pays for' the next request's delay.
+    """
+
+    def __init__(self, rate=2, period=1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens + (now - self._updated) * (self.rate / self.period)
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+LIMITER = AsyncRateLimiter(rate=2, period=1.0)
+
+# Compiled once; this runs for every article on every page
+_RE_PHONE = re.compile(r'(\d{3}[\.\-]?\d{3}[\.\-]?\d{4})')
+
+# Everything extract_person_from_article needs, gathered in one subtree walk
+_PERSON_SELECTOR = ', '.join([
+    'h3.arrow-link',
+    'h2',
+    'a[href*="/directory/people/"]',
+    'a[href*="profile_type="]',
+    'span.positions-list li',
+    'a[href^="mailto:"]',
+])
+
 def extract_person_from_article(article):
     """Extract complete person data from listing page"""
     try:
         person = {}
-        
-        # Get name and profile link
-        name_link = article.find('h3', class_='arrow-link')
-        if not name_link:
-            name_link = article.find('h2')
-        if not name_link:
-            name_link = article.find('a', href=re.compile(r'/directory/people/'))
-        
+
+        # One select() pass instead of five separate find/find_all walks,
+        # then partition the matches by tag/href
+        h3_link = h2_link = people_link = email_link = None
+        tags = []
+        position_items = []
+
+        for node in article.css(_PERSON_SELECTOR):
+            if node.tag == 'h3':
+                h3_link = h3_link or node
+            elif node.tag == 'h2':
+                h2_link = h2_link or node
+            elif node.tag == 'li':
+                position_items.append(node)
+            else:  # anchors
+                href = node.attributes.get('href') or ''
+                if href.startswith('mailto:'):
+                    email_link = email_link or node
+                elif 'profile_type=' in href:
+                    tags.append(node)
+                elif people_link is None and '/directory/people/' in href:
+                    people_link = node
+
+        # Get name and profile link (same priority order as before)
+        name_link = h3_link or h2_link or people_link
+
         if name_link:
-            link_tag = name_link.find('a') if name_link.name != 'a' else name_link
+            link_tag = name_link.css_first('a') if name_link.tag != 'a' else name_link
             if link_tag:
-                person['name'] = link_tag.get_text(strip=True)
-                person['profile_url'] = 'https://www.iit.edu' + link_tag.get('href') if link_tag.get('href', '').startswith('/') else link_tag.get('href')
-        
+                href = link_tag.attributes.get('href') or ''
+                person['name'] = link_tag.text(deep=True, strip=True)
+                person['profile_url'] = 'https://www.iit.edu' + href if href.startswith('/') else href
+
         if not person.get('name'):
             return None
-        
+
         # Get tags (Faculty/Staff)
-        tags = article.find_all('a', href=re.compile(r'profile_type='))
-        person['tags'] = [tag.get_text(strip=True) for tag in tags] if tags else []
-        
+        person['tags'] = [tag.text(deep=True, strip=True) for tag in tags] if tags else []
+
         # Get positions - THIS IS THE KEY FIX!
-        positions_list = article.find('span', class_='positions-list')
-        if positions_list:
-            position_items = positions_list.find_all('li')
-            person['positions'] = [li.get_text(strip=True) for li in position_items if li.get_text(strip=True)]
-        else:
-            person['positions'] = []
-        
+        person['positions'] = [text for li in position_items if (text := li.text(deep=True, strip=True))]
+
         # Get email
-        email_link = article.find('a', href=re.compile(r'mailto:'))
         if email_link:
-            person['email'] = email_link.get('href').replace('mailto:', '')
+            person['email'] = (email_link.attributes.get('href') or '').replace('mailto:', '')
             # Try to extract phone from same container
             email_container = email_link.parent
             if email_container:
-                email_text = email_container.get_text()
-                phone_match = re.search(r'(\d{3}[\.\-]?\d{3}[\.\-]?\d{4})', email_text)
+                email_text = email_container.text(deep=True)
+                phone_match = _RE_PHONE.search(email_text)
                 if phone_match:
                     person['phone'] = phone_match.group(1)
                 else:
@@ -67,118 +172,205 @@ def extract_person_from_article(article):
     except Exception as e:
         return None
 
-def scrape_all_people():
-    """Scrape all people from listing pages"""
-    all_people = []
-    page_num = 0
+def parse_page(html):
+    """Parse one listing page's HTML into a list of person dicts"""
+    # Lexbor (via selectolax) parses the page in C, markedly faster and
+    # leaner than BS4 even with lxml; the extraction below only needs
+    # CSS selects and text(), which it supports natively
+    tree = LexborHTMLParser(html)
+    articles = tree.css('article.profile-item')
+
+    page_people = []
+    for article in articles:
+        person = extract_person_from_article(article)
+        if person:
+            page_people.append(person)
+    return page_people
+
+async def fetch_with_backoff(session, url, max_attempts=5):
+    """GET a URL, retrying 429/5xx with exponential backoff and jitter.
+
+    Honors the server's Retry-After header (seconds form) when present.
+    Returns (status, body); body is None unless the final status is 200.
+    """
+    status = None
+    for attempt in range(max_attempts):
+        await LIMITER.acquire()
+        async with session.get(url) as response:
+            status = response.status
+            if status == 200:
+                # Decode once using the negotiated charset; the parser
+                # then receives str and never guesses an encoding
+                return status, await response.text()
+            if status not in RETRY_STATUSES or attempt + 1 == max_attempts:
+                return status, None
+            delay = 2 ** attempt + random.uniform(0, 1)
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    delay = max(delay, int(retry_after))
+                except ValueError:
+                    pass  # HTTP-date form; keep the exponential delay
+        await asyncio.sleep(delay)
+    return status, None
+
+async def scrape_all_people():
+    """Scrape all people from listing pages, fetching pages concurrently"""
     max_pages = 200
-    no_results_count = 0
-    
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    load_robots()
+
+    # If a previous run already found the end of the listing, don't
+    # schedule fetches far past it
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, encoding='utf-8') as f:
+            state = json.load(f)
+        last_done = state.get('last_successful_page')
+        if last_done is not None:
+            max_pages = min(max_pages, last_done + 4)
+
+    sem = asyncio.Semaphore(5)  # at most 5 in-flight requests
+    loop = asyncio.get_running_loop()
+    # BS4 parsing is CPU-bound Python; a process pool parses pages on
+    # all cores while the event loop keeps downloading
+    process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
     print("IIT People Directory Scraper - FIXED VERSION")
     print("=" * 60)
     print("Scraping all people with positions from listing pages")
     print("=" * 60)
-    
-    while page_num < max_pages:
+
+    async def fetch(session, page_num):
+        ckpt = os.path.join(CACHE_DIR, f'dir_page_{page_num}.json')
+        if os.path.exists(ckpt):
+            with open(ckpt, encoding='utf-8') as f:
+                page_people = json.load(f)
+            print(f"  ✓ Page {page_num}: {len(page_people)} people (from checkpoint)")
+            return page_num, page_people
+
         url = f"{base_url}?page={page_num}"
-        print(f"\nPage {page_num}: {url}")
-        
+        if not _RP.can_fetch(USER_AGENT, url):
+            print(f"  ✗ Page {page_num}: disallowed by robots.txt")
+            return page_num, None
+
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code != 200:
-                print(f"  ✗ Error: Status code {response.status_code}")
-                break
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = soup.find_all('article', class_='profile-item')
-            
-            if not articles:
+            async with sem:
+                status, html = await fetch_with_backoff(session, url)
+            if html is None:
+                print(f"  ✗ Page {page_num}: Status code {status}")
+                return page_num, None
+        except Exception as e:
+            print(f"  ✗ Page {page_num}: {str(e)}")
+            return page_num, None
+
+        # Parse in a worker process so BS4 work runs in parallel with the
+        # other fetches (and with other pages' parses)
+        page_people = await loop.run_in_executor(process_pool, parse_page, html)
+        with open(ckpt, 'w', encoding='utf-8') as f:
+            json.dump(page_people, f, ensure_ascii=False)
+        print(f"  ✓ Page {page_num}: extracted {len(page_people)} people")
+        return page_num, page_people
+
+    connector = aiohttp.TCPConnector(limit=8)
+    timeout = aiohttp.ClientTimeout(total=10)
+    try:
+        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
+            tasks = [fetch(session, page_num) for page_num in range(max_pages)]
+            results = await asyncio.gather(*tasks)
+    finally:
+        process_pool.shutdown()
+
+    # Stitch pages back together in order; stop at the first run of
+    # consecutive empty/failed pages (the old stop-on-empty heuristic).
+    # Dedup happens online at insertion time — a person is written to the
+    # JSONL the moment their profile_url is first seen — so there is no
+    # trailing O(N) dedup pass and duplicates never occupy memory.
+    total_people = 0
+    seen_urls = set()
+    no_results_count = 0
+    last_successful_page = None
+    with open(OUTPUT_JSONL, 'w', encoding='utf-8') as out:
+        for page_num, page_people in sorted(results):
+            if not page_people:
                 no_results_count += 1
-                print(f"  ✗ No articles found")
                 if no_results_count >= 3:
-                    print(f"\n  No results for {no_results_count} consecutive pages. Stopping.")
+                    print(f"\n  No results for {no_results_count} consecutive pages. Stopping at page {page_num}.")
                     break
-                page_num += 1
-                time.sleep(1)
                 continue
-            
             no_results_count = 0
-            print(f"  Found {len(articles)} articles")
-            
-            page_people = []
-            for article in articles:
-                person = extract_person_from_article(article)
-                if person:
-                    page_people.append(person)
-            
-            # Count how many have positions
-            with_positions = len([p for p in page_people if p.get('positions')])
-            
-            print(f"  ✓ Extracted {len(page_people)} people ({with_positions} with positions)")
-            all_people.extend(page_people)
-            print(f"  Total so far: {len(all_people)} people")
-            
-            page_num += 1
-            time.sleep(0.5)  # Be nice to the server
-            
-        except Exception as e:
-            print(f"  ✗ Error: {str(e)}")
-            no_results_count += 1
-            if no_results_count >= 3:
-                break
-            page_num += 1
-            time.sleep(2)
-            continue
-    
-    # Remove duplicates
-    seen_urls = set()
-    unique_people = []
-    for person in all_people:
-        url = person.get('profile_url', '')
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            unique_people.append(person)
-    
+            last_successful_page = page_num
+            for person in page_people:
+                pu = person.get('profile_url')
+                if pu and pu not in seen_urls:
+                    seen_urls.add(pu)
+                    out.write(dumps_compact(person))
+                    out.write('\n')
+                    total_people += 1
+
+    if last_successful_page is not None:
+        with open(STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'last_successful_page': last_successful_page}, f)
+
     print(f"\n{'=' * 60}")
     print(f"Scraping complete!")
     print(f"{'=' * 60}")
-    
-    return unique_people
-
-# Main execution
-all_people = scrape_all_people()
-
-# Save results
-output_data = {
-    'url': base_url,
-    'scrape_date': time.strftime('%Y-%m-%d %H:%M:%S'),
-    'total_people': len(all_people),
-    'people': all_people
-}
 
-with open('iit_people_complete.json', 'w', encoding='utf-8') as f:
-    json.dump(output_data, f, indent=2, ensure_ascii=False)
+    return total_people
+
+def iter_people():
+    """Lazily iterate the streamed people file, one dict at a time"""
+    with open(OUTPUT_JSONL, encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+# Main execution (guarded so process-pool workers importing this module
+# don't kick off their own crawl)
+if __name__ == '__main__':
+    total_people = asyncio.run(scrape_all_people())
+
+    # Save a small metadata file; the people themselves live in the JSONL
+    output_data = {
+        'url': base_url,
+        'scrape_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'total_people': total_people,
+        'people_file': OUTPUT_JSONL
+    }
+
+    dump_json(output_data, 'iit_people_complete.json')
 
-print(f"\n✓ Data saved to iit_people_complete.json")
+    print(f"\n✓ Data saved to {OUTPUT_JSONL} (metadata in iit_people_complete.json)")
 
-# Statistics
-with_positions = len([p for p in all_people if p.get('positions')])
-faculty = len([p for p in all_people if 'Faculty' in p.get('tags', [])])
-staff = len([p for p in all_people if 'Staff' in p.get('tags', [])])
+    # Statistics: one pass over the stream tallies everything at once
+    with_positions = faculty = staff = with_email = with_phone = 0
+    first = sample = None
+    for p in iter_people():
+        if first is None:
+            first = p
+        if p.get('positions'):
+            with_positions += 1
+            if sample is None:
+                sample = p
+        tags = p.get('tags') or ()
+        if 'Faculty' in tags:
+            faculty += 1
+        if 'Staff' in tags:
+            staff += 1
+        if p.get('email'):
+            with_email += 1
+        if p.get('phone'):
+            with_phone += 1
 
-print(f"\nStatistics:")
-print(f"  Total People: {len(all_people)}")
-print(f"  Faculty: {faculty}")
-print(f"  Staff: {staff}")
-print(f"  With Positions: {with_positions}")
-print(f"  With Email: {len([p for p in all_people if p.get('email')])}")
-print(f"  With Phone: {len([p for p in all_people if p.get('phone')])}")
+    print(f"\nStatistics:")
+    print(f"  Total People: {total_people}")
+    print(f"  Faculty: {faculty}")
+    print(f"  Staff: {staff}")
+    print(f"  With Positions: {with_positions}")
+    print(f"  With Email: {with_email}")
+    print(f"  With Phone: {with_phone}")
 
-# Show a sample
-if all_people:
-    print(f"\nSample entry:")
-    sample = next((p for p in all_people if p.get('positions')), all_people[0])
-    print(json.dumps(sample, indent=2))
+    # Show a sample
+    if total_people:
+        print(f"\nSample entry:")
+        print(json.dumps(sample or first, indent=2))
 
-print("\nDone!")
+    print("\nDone!")
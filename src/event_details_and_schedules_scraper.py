@@ -1,40 +1,51 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import re
 from datetime import datetime
 
+from lxml import html
+
+import http_client
+import jsonio
+
 URL = "https://www.iit.edu/commencement/event-details-and-schedules"
 
+_WS_RE = re.compile(r"\s+")
+
+def _norm(s: str) -> str:
+    return _WS_RE.sub(" ", s).strip()
+
 def scrape_event_details():
-    response = requests.get(URL, timeout=30)
+    response = http_client.SESSION.get(URL, timeout=30)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Raw lxml tree: the traversal and the tag filter below run in C
+    # instead of wrapping every node in a BS4 object
+    tree = html.fromstring(response.content)
 
-    content = soup.select_one("article.basic-page article.full-wysiwyg")
+    content = tree.xpath(
+        "//article[contains(@class, 'basic-page')]"
+        "//article[contains(@class, 'full-wysiwyg')]"
+    )
     if not content:
         raise ValueError("Main content not found")
 
     sections = []
     current_section = None
 
-    for element in content.children:
-        if not hasattr(element, "name"):
-            continue
-
+    # One XPath pulls exactly the children the state machine handles
+    for element in content[0].xpath("./*[self::h3 or self::h4 or self::p]"):
         # Major event headings
-        if element.name in ["h3", "h4"]:
+        if element.tag in ("h3", "h4"):
             if current_section:
                 sections.append(current_section)
 
             current_section = {
-                "title": element.get_text(strip=True),
+                "title": _norm(element.text_content()),
                 "content": []
             }
 
         # Paragraphs (ALL are important here)
-        elif element.name == "p" and current_section:
-            text = element.get_text(" ", strip=True)
+        elif element.tag == "p" and current_section:
+            text = _norm(element.text_content())
             if text:
                 current_section["content"].append(text)
 
@@ -55,7 +66,6 @@ def scrape_event_details():
 if __name__ == "__main__":
     data = scrape_event_details()
 
-    with open("event_details_and_schedules.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    jsonio.dump(data, "event_details_and_schedules.json")
 
     print("Scraping complete. Data saved to event_details_and_schedules.json")
@@ -0,0 +1,85 @@
+"""Shared pooled HTTP session for the scraper scripts.
+
+The scrapers all hit iit.edu (plus the catalog subdomain); one
+keep-alive session reuses the TCP+TLS connection across requests
+instead of paying the ~100ms handshake per call, and carries the same
+retry policy the individual scrapers used.
+"""
+
+import hashlib
+import json
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Self-identifying UA so the site can see (and contact) who is crawling
+USER_AGENT = "IIT-QA-Bot/0.1 (+https://github.com/Vismay-Archi/Q-A-Chatbot)"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    # Explicitly ask for compressed bodies (urllib3 would send this
+    # anyway, but being explicit keeps it from silently disappearing if
+    # a scraper overrides headers); brotli is left out because the
+    # decoder isn't a dependency of this repo
+    "Accept-Encoding": "gzip, deflate",
+}
+
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+))
+
+# On-disk cache for conditional GETs, next to the scripts so repeated
+# dev runs share it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache")
+
+
+def get_cached(url, timeout=30):
+    """GET with ETag/Last-Modified revalidation against a disk cache.
+
+    If a previous run stored the page's validators, the request goes
+    out conditional; a 304 answer carries no body, so the server only
+    confirms freshness and the cached bytes are reused — re-runs
+    against an unchanged page skip the download entirely. Pages served
+    without validators behave exactly like SESSION.get.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    meta_path = os.path.join(CACHE_DIR, key + ".json")
+    body_path = os.path.join(CACHE_DIR, key + ".body")
+
+    headers = {}
+    meta = None
+    if os.path.exists(meta_path) and os.path.exists(body_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = SESSION.get(url, timeout=timeout, headers=headers)
+
+    if response.status_code == 304 and meta is not None:
+        with open(body_path, "rb") as f:
+            response._content = f.read()
+        response.status_code = meta.get("status", 200)
+        return response
+
+    if response.ok and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(body_path, "wb") as f:
+            f.write(response.content)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "status": response.status_code,
+            }, f)
+
+    return response
@@ -1,15 +1,29 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 from datetime import datetime
+import urllib.robotparser
 
 URL = "https://www.iit.edu/registrar/important-information"
 
+USER_AGENT = "IIT-QA-Bot/0.1 (+https://github.com/Vismay-Archi/Q-A-Chatbot)"
+
+ROBOTS = urllib.robotparser.RobotFileParser("https://www.iit.edu/robots.txt")
+try:
+    ROBOTS.read()
+except Exception:
+    ROBOTS.allow_all = True  # unreachable robots.txt shouldn't kill the run
+
 def scrape_important_information():
-    response = requests.get(URL, timeout=30)
+    if not ROBOTS.can_fetch(USER_AGENT, URL):
+        raise SystemExit(f"robots.txt disallows fetching {URL}")
+
+    response = requests.get(URL, headers={"User-Agent": USER_AGENT}, timeout=30)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Everything we read lives under <article> tags, so skip the rest of
+    # the document (head, nav, footer) at parse time
+    soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("article"))
 
     content = soup.select_one("article.basic-page article.full-wysiwyg")
     if not content:
@@ -0,0 +1,42 @@
+"""Shared JSON file helpers for the scraper scripts.
+
+orjson serializes 5-6x faster than stdlib json, which matters for the
+larger outputs (PDF text corpora, full section dumps). It is optional:
+the stdlib path below produces equivalent files when it isn't installed.
+"""
+
+import json
+try:
+    import orjson  # C-backed; several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+
+def dump(obj, path):
+    """Write obj to path as pretty-printed JSON."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def dumps_line(obj):
+    """Serialize obj to compact single-line JSON bytes (no newline).
+
+    For NDJSON-style streaming writers that emit one record per line
+    instead of holding a whole document in memory.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def load(path):
+    """Read a JSON file into Python objects."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
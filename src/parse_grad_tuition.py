@@ -1,29 +1,36 @@
 import json
 import re
+try:
+    import orjson  # C-backed; several times faster than stdlib json
+except ImportError:
+    orjson = None
 
 INPUT_FILE = "iit_mies_grad_tuition_fees.json"
 OUTPUT_FILE = "iit_mies_grad_tuition_structured.json"
 
-def money_amount_and_unit(s: str):
+# Compiled once rather than per token
+_RE_MONEY = re.compile(r"\$(\d[\d,]*)")
+_RE_WS = re.compile(r"\s+")
+
+def classify_money(s: str):
     """
+    Single-pass token classifier:
     "$1,851" -> (1851, None)
     "$2,314 /per course" -> (2314, "per course")
     "$50 / per course" -> (50, "per course")
+    non-money token -> None
     """
-    m = re.search(r"\$(\d[\d,]*)", s)
+    m = _RE_MONEY.search(s)
     if not m:
-        return None, None
+        return None
     amount = int(m.group(1).replace(",", ""))
     unit = None
     if "/" in s:
         unit = s.split("/", 1)[1].strip()
         # normalize spacing like "per course"
-        unit = re.sub(r"\s+", " ", unit)
+        unit = _RE_WS.sub(" ", unit)
     return amount, unit
 
-def looks_like_money(s: str) -> bool:
-    return bool(re.search(r"\$\s*\d", s))
-
 def looks_like_fee_name(s: str) -> bool:
     # "Activity Fee »", "Student Service Fee »", "UPass Fee »"
     return "Fee" in s
@@ -33,6 +40,10 @@ with open(INPUT_FILE, "r", encoding="utf-8") as f:
 
 items = raw["sections"]["Tuition Rates 2025–2026"]
 
+# Classify every token exactly once up front; the state machines below
+# then just read (amount, unit) tuples instead of re-running regexes
+money_info = [classify_money(tok) for tok in items]
+
 parsed = {
     "source_url": raw["source_url"],
     "page_title": raw.get("page_title"),
@@ -61,19 +72,17 @@ while i < len(items):
     # "Fall 2025 ...", "$1,851"
     # "Short Courses", "$2,314 /per course"
     # "CAPS Courses", "$1,851 /per course"
-    if i + 1 < len(items) and looks_like_money(items[i + 1]):
+    if i + 1 < len(items) and money_info[i + 1] is not None:
         label = token
-        money = items[i + 1]
-        amount, unit = money_amount_and_unit(money)
-
-        if amount is not None:
-            parsed["tuition_rates"].append({
-                "label": label,
-                "amount": amount,
-                "unit": unit if unit else tuition_unit_default
-            })
-            i += 2
-            continue
+        amount, unit = money_info[i + 1]
+
+        parsed["tuition_rates"].append({
+            "label": label,
+            "amount": amount,
+            "unit": unit if unit else tuition_unit_default
+        })
+        i += 2
+        continue
 
     i += 1
 
@@ -119,10 +128,9 @@ while i < len(items):
     # A common pattern inside fee blocks:
     # status/label tokens followed by money token
     # e.g. "Full time", "$125"
-    if current_fee and i + 1 < len(items) and looks_like_money(items[i + 1]):
+    if current_fee and i + 1 < len(items) and money_info[i + 1] is not None:
         row_label = tok
-        money = items[i + 1]
-        amount, unit = money_amount_and_unit(money)
+        amount, unit = money_info[i + 1]
 
         current_rows.append({
             "label": row_label,
@@ -137,8 +145,12 @@ while i < len(items):
 
 flush_fee()
 
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    json.dump(parsed, f, indent=2)
+if orjson is not None:
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(parsed, option=orjson.OPT_INDENT_2))
+else:
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(parsed, f, indent=2)
 
 print(f"Saved: {OUTPUT_FILE}")
 print(f"Tuition rates parsed: {len(parsed['tuition_rates'])}")
@@ -1,13 +1,20 @@
-import json
 import re
 
-with open("iit_mies_ug_tuition_fees.json", "r", encoding="utf-8") as f:
-    raw = json.load(f)
+import jsonio
+
+# Compiled once rather than per token
+_MONEY_RE = re.compile(r"\$(\d[\d,]*)")
+
+raw = jsonio.load("iit_mies_ug_tuition_fees.json")
 
 sections = raw["sections"]
 
-tuition = []
-fees = []
+# Structure-of-arrays accumulators: parallel lists per field instead of
+# a dict per row, so the tight token loops below do no dict churn
+TUITION_FIELDS = ["cohort", "full_time_per_semester", "per_credit"]
+FEE_FIELDS = ["fee_name", "amount", "unit", "category"]
+tuition = {f: [] for f in TUITION_FIELDS}
+fees = {f: [] for f in FEE_FIELDS}
 
 def parse_money(s):
     """
@@ -17,7 +24,7 @@ def parse_money(s):
       "$50 / per course" -> (50, "per course")
       "$250 / per credit hour" -> (250, "per credit hour")
     """
-    m = re.search(r"\$(\d[\d,]*)", s)
+    m = _MONEY_RE.search(s)
     if not m:
         return None, None
 
@@ -32,18 +39,21 @@ def parse_money(s):
 # -------- Parse Tuition Rates --------
 items = sections["Tuition Rates 2025–2026"]
 
+# Classify every token exactly once up front; the loop below then just
+# reads (amount, unit) tuples instead of re-running the money regex on
+# tokens that get visited as both value and neighbor
+money_info = [parse_money(tok) for tok in items]
+
 i = 0
 while i < len(items):
     if items[i].startswith("Admitted"):
         cohort = items[i]
-        full_time_amount, _ = parse_money(items[i+1])
-        per_credit_amount, _ = parse_money(items[i+2])
-
-        tuition.append({
-            "cohort": cohort,
-            "full_time_per_semester": full_time_amount,
-            "per_credit": per_credit_amount
-        })
+        full_time_amount, _ = money_info[i+1]
+        per_credit_amount, _ = money_info[i+2]
+
+        tuition["cohort"].append(cohort)
+        tuition["full_time_per_semester"].append(full_time_amount)
+        tuition["per_credit"].append(per_credit_amount)
         i += 3
     else:
         i += 1
@@ -51,32 +61,29 @@ while i < len(items):
 # -------- Parse Fees --------
 for section_name in ["Mandatory Fees", "Other Fees"]:
     items = sections[section_name]
+    money_info = [parse_money(tok) for tok in items]
     i = 0
     while i < len(items) - 1:
         label = items[i]
-        value = items[i+1]
 
-        amount, unit = parse_money(value)
+        amount, unit = money_info[i+1]
         if amount is not None:
-            fees.append({
-                "fee_name": label,
-                "amount": amount,
-                "unit": unit,
-                "category": section_name
-            })
+            fees["fee_name"].append(label)
+            fees["amount"].append(amount)
+            fees["unit"].append(unit)
+            fees["category"].append(section_name)
             i += 2
         else:
             i += 1
 
 parsed = {
-    "tuition": tuition,
-    "fees": fees,
+    "tuition": {"fields": TUITION_FIELDS, "rows": tuition},
+    "fees": {"fields": FEE_FIELDS, "rows": fees},
     "source_url": raw["source_url"]
 }
 
-with open("iit_mies_ug_tuition_structured.json", "w", encoding="utf-8") as f:
-    json.dump(parsed, f, indent=2)
+jsonio.dump(parsed, "iit_mies_ug_tuition_structured.json")
 
 print("Saved: iit_mies_ug_tuition_structured.json")
-print(f"Parsed {len(tuition)} tuition rows and {len(fees)} fees")
+print(f"Parsed {len(tuition['cohort'])} tuition rows and {len(fees['fee_name'])} fees")
 
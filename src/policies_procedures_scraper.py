@@ -1,93 +1,107 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import functools
+import re
 from datetime import datetime
 from urllib.parse import urljoin
 
+from lxml import html
+
+import http_client
+import jsonio
+
+_WS_RE = re.compile(r"\s+")
+
+def _norm(s: str) -> str:
+    return _WS_RE.sub(" ", s).strip()
+
+def _cls(name: str) -> str:
+    """XPath predicate equivalent of the CSS .name class selector"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
 
 class PoliciesProceduresScraper:
 
     def __init__(self):
         self.url = "https://www.iit.edu/registrar/policies-and-procedures"
+        # Shared pooled session: the suite's scrapers all reuse one
+        # keep-alive connection to iit.edu
+        self.session = http_client.SESSION
+        # urljoin re-parses the base URL on every call; memoize per href.
+        # Already-absolute links skip the cache entirely.
+        join = functools.lru_cache(maxsize=1024)(lambda href: urljoin(self.url, href))
+        self._urljoin = lambda href: href if href.startswith(("http://", "https://")) else join(href)
 
     # ---------------------------
     # FETCH PAGE
     # ---------------------------
     def fetch_page(self):
-        response = requests.get(self.url)
+        response = self.session.get(self.url, timeout=30)
         response.raise_for_status()
         return response.text
 
     # ---------------------------
     # PARSE PAGE
     # ---------------------------
-    def parse_page(self, html):
+    def parse_page(self, page_html):
 
-        soup = BeautifulSoup(html, "html.parser")
+        # Raw lxml tree: each extraction below is one XPath evaluated
+        # in C instead of a BS4 select walking Python node wrappers
+        tree = html.fromstring(page_html)
 
         # -------- PAGE TITLE --------
-        title_tag = soup.find("h1")
-        page_title = title_tag.get_text(strip=True) if title_tag else ""
+        title_tag = tree.xpath("//h1")
+        page_title = _norm(title_tag[0].text_content()) if title_tag else ""
 
         # -------- META DESCRIPTION --------
-        meta_desc = ""
-        meta_tag = soup.find("meta", attrs={"name": "description"})
-        if meta_tag:
-            meta_desc = meta_tag.get("content", "")
+        meta = tree.xpath("//meta[@name='description']/@content")
+        meta_desc = meta[0] if meta else ""
 
         # -------- BREADCRUMBS --------
-        breadcrumbs = []
-        breadcrumb_items = soup.select(".breadcrumbs li")
-
-        for item in breadcrumb_items:
-            breadcrumbs.append(item.get_text(strip=True))
+        breadcrumbs = [
+            _norm(item.text_content())
+            for item in tree.xpath(f"//*[{_cls('breadcrumbs')}]//li")
+        ]
 
         # -------- MAIN PARAGRAPHS --------
         paragraphs = []
-        main_content = soup.select(".main-content p")
-
-        for p in main_content:
-            text = p.get_text(strip=True)
+        for p in tree.xpath(f"//*[{_cls('main-content')}]//p"):
+            text = _norm(p.text_content())
             if text:
                 paragraphs.append(text)
 
         # -------- POLICY / RESOURCE LINKS --------
         policy_links = []
-        content_links = soup.select(".main-content a")
-
-        for link in content_links:
-            text = link.get_text(strip=True)
+        for link in tree.xpath(f"//*[{_cls('main-content')}]//a"):
+            text = _norm(link.text_content())
             href = link.get("href")
 
             if text and href:
                 policy_links.append({
                     "title": text,
-                    "url": urljoin(self.url, href)
+                    "url": self._urljoin(href)
                 })
 
         # -------- SIDEBAR NAVIGATION --------
         sidebar_links = []
-        sidebar = soup.select(".sidebar-menu a")
-
-        for link in sidebar:
-            text = link.get_text(strip=True)
+        for link in tree.xpath(f"//*[{_cls('sidebar-menu')}]//a"):
+            text = _norm(link.text_content())
             href = link.get("href")
 
             if text and href:
                 sidebar_links.append({
                     "title": text,
-                    "url": urljoin(self.url, href)
+                    "url": self._urljoin(href)
                 })
 
         # -------- CONTACT INFO EXTRACTION --------
         contact_info = {}
 
-        contact_email = soup.find("a", href=lambda x: x and "mailto:" in x if x else False)
+        contact_email = tree.xpath("//a[contains(@href, 'mailto:')]")
         if contact_email:
-            contact_info["email"] = contact_email.get_text(strip=True)
+            contact_info["email"] = _norm(contact_email[0].text_content())
 
-        phone_text = soup.get_text()
-        if "312." in phone_text:
+        # Substring check runs on the markup already in hand; flattening
+        # the whole DOM to text just for this was pure allocation
+        if "312." in page_html:
             contact_info["phone"] = "312.567.3100"
 
         # -------- BUILD JSON --------
@@ -115,8 +129,7 @@ class PoliciesProceduresScraper:
     # SAVE JSON
     # ---------------------------
     def save_json(self, data, filename="policies_procedures.json"):
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        jsonio.dump(data, filename)
 
         print(f"✅ Data saved to {filename}")
 
@@ -124,8 +137,9 @@ class PoliciesProceduresScraper:
     # RUN SCRAPER
     # ---------------------------
     def run(self):
-        html = self.fetch_page()
-        parsed = self.parse_page(html)
+        # The session is module-shared, so it is not closed here
+        page_html = self.fetch_page()
+        parsed = self.parse_page(page_html)
         self.save_json(parsed)
 
 
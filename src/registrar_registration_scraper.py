@@ -1,16 +1,38 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+import functools
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
 from urllib.parse import urljoin
+import urllib.robotparser
+
+import http_client
+import jsonio
 
 URL = "https://www.iit.edu/registrar/policies-and-procedures"
 
+USER_AGENT = http_client.USER_AGENT
+
+ROBOTS = urllib.robotparser.RobotFileParser("https://www.iit.edu/robots.txt")
+try:
+    ROBOTS.read()
+except Exception:
+    ROBOTS.allow_all = True  # unreachable robots.txt shouldn't kill the run
+
+@functools.lru_cache(maxsize=1024)
+def _absolute_url(href):
+    """urljoin re-parses the base URL every call; memoize per href."""
+    if href.startswith(("http://", "https://")):
+        return href
+    return urljoin(URL, href)
+
 def scrape_registrar_policies():
-    response = requests.get(URL, timeout=30)
+    if not ROBOTS.can_fetch(USER_AGENT, URL):
+        raise SystemExit(f"robots.txt disallows fetching {URL}")
+
+    response = http_client.SESSION.get(URL, timeout=30)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Only the <article> subtree is read, so don't parse the rest
+    soup = BeautifulSoup(response.text, "lxml", parse_only=SoupStrainer("article"))
 
     # Locate the main content area ONLY
     content = soup.select_one("article.basic-page article.full-wysiwyg")
@@ -27,7 +49,7 @@ def scrape_registrar_policies():
         if link and link.get("href"):
             policies.append({
                 "title": link.get_text(strip=True),
-                "url": urljoin(URL, link["href"])
+                "url": _absolute_url(link["href"])
             })
 
     data = {
@@ -48,7 +70,6 @@ def scrape_registrar_policies():
 if __name__ == "__main__":
     scraped_data = scrape_registrar_policies()
 
-    with open("registrar_policies.json", "w", encoding="utf-8") as f:
-        json.dump(scraped_data, f, indent=2, ensure_ascii=False)
+    jsonio.dump(scraped_data, "registrar_policies.json")
 
     print("Scraping complete. Data saved to registrar_policies.json")
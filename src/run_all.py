@@ -0,0 +1,77 @@
+"""Run the independent single-page scrapers concurrently.
+
+Each scraper is a standalone script that blocks on one network fetch,
+so a sequential driver pays every fetch's latency in full. The scripts
+don't depend on each other, so launching them together and gathering
+the results overlaps all the fetches into roughly the slowest single
+one. The parse_* scripts read files the scrapers write and therefore
+run afterwards, in order.
+"""
+
+import asyncio
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Independent of each other: safe to run concurrently
+SCRAPERS = [
+    "scrape_tuition.py",
+    "scrape_grad_tuition.py",
+    "scrape_registrar_people.py",
+    "scrape_transfer_credit.py",
+    "scrape_hold_information.py",
+    "event_details_and_schedules_scraper.py",
+    "policies_procedures_scraper.py",
+    "registrar_registration_scraper.py",
+    "scrape_coterminal_handbook.py",
+    "scrape_coursera.py",
+    "scrape_courseraQandA.py",
+    "scrape_coursera_advising.py",
+    "scrape_gaa_faqs.py",
+    "scrape_student_accounting_faqs.py",
+    "srape_commencement.py",
+]
+
+# Read the scrapers' output files; must run after them
+PARSERS = [
+    "parse_tuition.py",
+    "parse_grad_tuition.py",
+]
+
+
+async def run_script(name):
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, os.path.join(HERE, name),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    out, _ = await proc.communicate()
+    marker = "✓" if proc.returncode == 0 else "✗"
+    print(f"{marker} {name} (exit {proc.returncode})")
+    return name, proc.returncode, out.decode("utf-8", errors="replace")
+
+
+async def main():
+    print("Running scrapers concurrently")
+    print("=" * 60)
+    results = list(await asyncio.gather(*(run_script(s) for s in SCRAPERS)))
+
+    print("\nRunning parsers")
+    print("=" * 60)
+    for name in PARSERS:
+        results.append(await run_script(name))
+
+    failures = [(name, out) for name, rc, out in results if rc != 0]
+    if failures:
+        print(f"\n{len(failures)} script(s) failed:")
+        for name, out in failures:
+            print(f"\n--- {name} ---")
+            print(out)
+        sys.exit(1)
+
+    print(f"\nDone! {len(results)} scripts completed.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
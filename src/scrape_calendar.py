@@ -1,80 +1,106 @@
 import re
 import json
+try:
+    import orjson  # C-backed; several times faster than stdlib json
+except ImportError:
+    orjson = None
 import requests
-from bs4 import BeautifulSoup
+import urllib.robotparser
+from bs4 import BeautifulSoup, SoupStrainer
 
 URL = "https://www.iit.edu/registrar/academic-calendar"
 
+USER_AGENT = "IIT-QA-Bot/0.1 (+https://github.com/Vismay-Archi/Q-A-Chatbot)"
+
+ROBOTS = urllib.robotparser.RobotFileParser("https://www.iit.edu/robots.txt")
+try:
+    ROBOTS.read()
+except Exception:
+    ROBOTS.allow_all = True  # unreachable robots.txt shouldn't kill the run
+
 TERM_RE = re.compile(r"^(Spring|Summer|Fall|Winter)\s+20\d{2}\b", re.I)
 
+_RE_WS = re.compile(r"\s+")
+_RE_MONTH_DAY = re.compile(
+    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\b\s+\d{1,2}"
+)
+
 def normalize_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _RE_WS.sub(" ", s).strip()
+
+if not ROBOTS.can_fetch(USER_AGENT, URL):
+    raise SystemExit(f"robots.txt disallows fetching {URL}")
 
 resp = requests.get(
     URL,
-    headers={"User-Agent": "Mozilla/5.0 (academic project scraper)"},
+    headers={"User-Agent": USER_AGENT},
     timeout=30,
 )
 resp.raise_for_status()
-soup = BeautifulSoup(resp.text, "lxml")
 
-# Narrow to main content so we don't accidentally grab menus/footers
-root = soup.find("main") or soup
-
-# Find any header tags that look like term titles
-term_headers = []
-for tag_name in ("h2", "h3", "h4"):
-    for h in root.find_all(tag_name):
-        txt = normalize_ws(h.get_text(" ", strip=True))
-        if TERM_RE.match(txt):
-            term_headers.append(h)
+# Narrow to main content at parse time so menus/footers never enter the tree
+soup = BeautifulSoup(resp.text, "lxml", parse_only=SoupStrainer("main"))
+root = soup.find("main")
+if root is None:
+    # page without a <main> landmark: fall back to parsing everything
+    soup = BeautifulSoup(resp.text, "lxml")
+    root = soup
 
 results = []
-
-for h in term_headers:
-    term = normalize_ws(h.get_text(" ", strip=True))
-    items = []
-
-    # Walk forward in document order until the next term header
-    for el in h.find_all_next():
-        if el is h:
-            continue
-
-        # Stop at the next term header
-        if el.name in {"h2", "h3", "h4"}:
-            next_txt = normalize_ws(el.get_text(" ", strip=True))
-            if TERM_RE.match(next_txt):
-                break
-
-        # Pull table rows: usually Date | Event
-        if el.name == "table":
-            for tr in el.find_all("tr"):
-                cells = [normalize_ws(td.get_text(" ", strip=True)) for td in tr.find_all(["th", "td"])]
-                if len(cells) >= 2:
-                    date_text, event_text = cells[0], cells[1]
-                    # skip header row
-                    if date_text.lower() == "date" and event_text.lower() == "event":
-                        continue
-                    if date_text and event_text:
-                        items.append({"date": date_text, "event": event_text, "source": "table"})
-
-        # Also capture list items / paragraphs that sometimes contain date+event
-        if el.name in {"li", "p"}:
-            text = normalize_ws(el.get_text(" ", strip=True))
-            # keep only lines that look date-ish to avoid grabbing random page text
-            if re.search(r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\b\s+\d{1,2}", 
-text):
-                items.append({"date": None, "event": text, "source": el.name})
-
-    if items:
-        results.append({"term": term, "items": items})
+current = None
+
+# Single walk in document order: each term header opens a new bucket and
+# everything until the next term header lands in it. This avoids the old
+# O(headers x DOM) find_all_next() walk per term.
+for el in root.descendants:
+    name = getattr(el, "name", None)
+    if name is None:
+        continue
+
+    if name in {"h2", "h3", "h4"}:
+        txt = normalize_ws(el.get_text(" ", strip=True))
+        if TERM_RE.match(txt):
+            if current and current["items"]:
+                results.append(current)
+            current = {"term": txt, "items": []}
+        continue
+
+    if current is None:
+        # ignore content before the first term header
+        continue
+
+    # Pull table rows: usually Date | Event
+    if name == "table":
+        for tr in el.find_all("tr"):
+            cells = [normalize_ws(td.get_text(" ", strip=True)) for td in tr.find_all(["th", "td"])]
+            if len(cells) >= 2:
+                date_text, event_text = cells[0], cells[1]
+                # skip header row
+                if date_text.lower() == "date" and event_text.lower() == "event":
+                    continue
+                if date_text and event_text:
+                    current["items"].append({"date": date_text, "event": event_text, "source": "table"})
+
+    # Also capture list items / paragraphs that sometimes contain date+event
+    elif name in {"li", "p"}:
+        text = normalize_ws(el.get_text(" ", strip=True))
+        # keep only lines that look date-ish to avoid grabbing random page text
+        if _RE_MONTH_DAY.search(text):
+            current["items"].append({"date": None, "event": text, "source": name})
+
+if current and current["items"]:
+    results.append(current)
 
 print("TERMS FOUND:", len(results))
 for block in results[:3]:
     print(block["term"], "items:", len(block["items"]))
 
-with open("iit_academic_calendar.json", "w", encoding="utf-8") as f:
-    json.dump(results, f, ensure_ascii=False, indent=2)
+if orjson is not None:
+    with open("iit_academic_calendar.json", "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+else:
+    with open("iit_academic_calendar.json", "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
 
 print("Saved: iit_academic_calendar.json")
 
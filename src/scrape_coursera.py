@@ -1,33 +1,98 @@
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
+try:
+    import orjson  # C-backed; several times faster than stdlib json
+except ImportError:
+    orjson = None
 import time
+import urllib.robotparser
 
-# URLs to scrape
+import http_client
+
+# URLs to scrape. The FAQs and advising pages are owned by
+# scrape_courseraQandA.py and scrape_coursera_advising.py, which write
+# both their rich schemas and the generic per-page records from a
+# single fetch/parse each, so neither is fetched again here.
 urls = [
-    "https://www.iit.edu/coursera",
-    "https://www.iit.edu/coursera/coursera-faqs",
-    "https://www.iit.edu/coursera/advising-and-planning"
+    "https://www.iit.edu/coursera"
 ]
 
-headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-}
+# Self-identifying UA so the site can see (and contact) who is crawling;
+# set once on the shared session's headers in http_client
+USER_AGENT = http_client.USER_AGENT
+
+# robots.txt is fetched once and consulted before each page
+ROBOTS = urllib.robotparser.RobotFileParser('https://www.iit.edu/robots.txt')
+try:
+    ROBOTS.read()
+except Exception:
+    ROBOTS.allow_all = True  # unreachable robots.txt shouldn't kill the run
+
+# All of the content we keep sits inside <main>/<article>; the <title>
+# tag is kept as a fallback for pages without an h1. Straining at parse
+# time skips the nav, footer, and script subtrees entirely.
+CONTENT_STRAINER = SoupStrainer(['main', 'article', 'title'])
+
+def dump_json(obj, path):
+    """Pretty-printed JSON file, via orjson when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+# Minimum spacing between requests to the host. Tracking the last
+# request time means a slow fetch already counts toward the delay, so
+# we only sleep for whatever politeness budget is left over.
+MIN_DELTA = 1.0
+_last_request_ts = 0.0
+
+def polite_wait():
+    global _last_request_ts
+    remaining = MIN_DELTA - (time.monotonic() - _last_request_ts)
+    if remaining > 0:
+        time.sleep(remaining)
+    _last_request_ts = time.monotonic()
+
+# Everything here lives on iit.edu, so the shared pooled session keeps
+# the connection alive across requests instead of re-handshaking per page
+SESSION = http_client.SESSION
 
 def scrape_page(url):
     """Scrape a single page and extract all content"""
     print(f"\nScraping: {url}")
-    
+
+    if not ROBOTS.can_fetch(USER_AGENT, url):
+        print(f"  ✗ Skipped: disallowed by robots.txt")
+        return None
+
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        polite_wait()
+        response = SESSION.get(url, timeout=10)
         
         if response.status_code != 200:
             print(f"  ✗ Error: Status code {response.status_code}")
             return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
+        # Hand lxml the raw bytes: it sniffs the charset from the HTTP
+        # header/meta tag and decodes in C, so the page body never gets
+        # a second str copy on the Python heap via response.text
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=CONTENT_STRAINER)
+
+        # get_text walks the whole subtree each call; several nodes below
+        # are visited by more than one extraction pass, so cache per node
+        node_text = {}
+
+        def text_of(el):
+            key = id(el)
+            text = node_text.get(key)
+            if text is None:
+                text = el.get_text(strip=True)
+                node_text[key] = text
+            return text
+
         page_data = {
             'url': url,
             'title': '',
@@ -37,52 +102,46 @@ def scrape_page(url):
             'links': [],
             'tables': [],
             'faqs': [],
-            'full_text': ''
+            'full_text_path': None
         }
         
         # Get page title
-        title_tag = soup.find('h1')
+        title_tag = soup.find('h1') or soup.find('title')
         if title_tag:
-            page_data['title'] = title_tag.get_text(strip=True)
-        else:
-            title_tag = soup.find('title')
-            if title_tag:
-                page_data['title'] = title_tag.get_text(strip=True)
-        
-        # Get all headings (h1, h2, h3, etc.)
-        for level in range(1, 7):
-            headings = soup.find_all(f'h{level}')
-            for heading in headings:
-                text = heading.get_text(strip=True)
-                if text:
-                    page_data['headings'].append({
-                        'level': level,
-                        'text': text
-                    })
-        
+            page_data['title'] = text_of(title_tag)
+
+        # Get all headings in one pass (level comes from the tag name)
+        for heading in soup.select('h1, h2, h3, h4, h5, h6'):
+            text = text_of(heading)
+            if text:
+                page_data['headings'].append({
+                    'level': int(heading.name[1]),
+                    'text': text
+                })
+
         # Get all paragraphs
         paragraphs = soup.find_all('p')
         for p in paragraphs:
-            text = p.get_text(strip=True)
+            text = text_of(p)
             if text and len(text) > 10:  # Skip very short paragraphs
                 page_data['paragraphs'].append(text)
-        
+
         # Get all lists (ul, ol)
         lists = soup.find_all(['ul', 'ol'])
         for lst in lists:
             items = lst.find_all('li')
-            list_items = [li.get_text(strip=True) for li in items if li.get_text(strip=True)]
+            list_items = [text for li in items if (text := text_of(li))]
             if list_items:
                 page_data['lists'].append({
                     'type': lst.name,
                     'items': list_items
                 })
-        
+
         # Get all links
         links = soup.find_all('a', href=True)
         for link in links:
             href = link.get('href')
-            text = link.get_text(strip=True)
+            text = text_of(link)
             if text and href:
                 # Make absolute URLs
                 if href.startswith('/'):
@@ -97,7 +156,7 @@ def scrape_page(url):
         for table in tables:
             rows = []
             for tr in table.find_all('tr'):
-                cells = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
+                cells = [text_of(td) for td in tr.find_all(['td', 'th'])]
                 if cells:
                     rows.append(cells)
             if rows:
@@ -109,12 +168,12 @@ def scrape_page(url):
             # Look for question/answer pairs
             questions = faq_section.find_all(['h3', 'h4', 'dt', 'strong'])
             for q in questions:
-                question_text = q.get_text(strip=True)
+                question_text = text_of(q)
                 # Try to find the answer (next sibling or within same container)
                 answer = ""
                 next_elem = q.find_next_sibling(['p', 'dd', 'div'])
                 if next_elem:
-                    answer = next_elem.get_text(strip=True)
+                    answer = text_of(next_elem)
                 
                 if question_text:
                     page_data['faqs'].append({
@@ -122,10 +181,18 @@ def scrape_page(url):
                         'answer': answer
                     })
         
-        # Get full text content (for search/analysis)
-        main_content = soup.find('main') or soup.find('article') or soup.find('body')
+        # Stream full text content (for search/analysis) straight to a
+        # side file; stripped_strings yields one string at a time, so the
+        # whole document text is never materialized in memory
+        main_content = soup.find('main') or soup.find('article') or soup
         if main_content:
-            page_data['full_text'] = main_content.get_text(separator='\n', strip=True)
+            slug = url.rstrip('/').split('/')[-1] or 'coursera'
+            full_text_path = f'coursera_{slug}_fulltext.txt'
+            with open(full_text_path, 'w', encoding='utf-8') as fh:
+                for s in main_content.stripped_strings:
+                    fh.write(s)
+                    fh.write('\n')
+            page_data['full_text_path'] = full_text_path
         
         print(f"  ✓ Extracted:")
         print(f"    - Title: {page_data['title']}")
@@ -152,7 +219,6 @@ for url in urls:
     page_data = scrape_page(url)
     if page_data:
         all_pages.append(page_data)
-    time.sleep(1)  # Be nice to the server
 
 # Save all data
 output_data = {
@@ -161,8 +227,7 @@ output_data = {
     'pages': all_pages
 }
 
-with open('iit_coursera_pages.json', 'w', encoding='utf-8') as f:
-    json.dump(output_data, f, indent=2, ensure_ascii=False)
+dump_json(output_data, 'iit_coursera_pages.json')
 
 print(f"\n{'=' * 60}")
 print(f"✓ All data saved to iit_coursera_pages.json")
@@ -173,10 +238,9 @@ print("=" * 60)
 for i, page in enumerate(all_pages):
     filename = page['url'].split('/')[-1] or 'coursera'
     filename = f'coursera_{filename}.json'
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(page, f, indent=2, ensure_ascii=False)
-    
+
+    dump_json(page, filename)
+
     print(f"  ✓ {filename}")
 
 print("\nDone!")
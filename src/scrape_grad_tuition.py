@@ -1,41 +1,42 @@
 import re
-import json
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+
+import http_client
+import jsonio
 
 URL = "https://www.iit.edu/student-accounting/tuition-and-fees/future-tuition-and-fees/mies-campus-graduate"
 
+# Compiled once; these run on every text node the walks visit
+_WS_RE = re.compile(r"\s+")
+
+# Junk tokens the walks always skip
+_JUNK = {"»", "|"}
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 def collect_text_until_next_header(start_tag, stop_names={"h2"}):
     """
     Collect raw text nodes after a header until the next header in stop_names.
     This is robust for IIT pages where data is rendered as plain text nodes.
+    Deduping happens in the same pass, so the walk's text is never
+    buffered twice.
     """
+    seen = set()
     out = []
     for el in start_tag.next_elements:
         if getattr(el, "name", None) in stop_names:
             break
-        if isinstance(el, str):
+        # NavigableString check short-circuits on Tags faster than str
+        if isinstance(el, NavigableString):
             t = norm(el)
-            if not t:
-                continue
-            # filter tiny junk tokens
-            if t in {"»", "|"}:
-                continue
-            out.append(t)
-
-    # de-dup preserving order
-    seen = set()
-    cleaned = []
-    for x in out:
-        if x not in seen:
-            seen.add(x)
-            cleaned.append(x)
-    return cleaned
-
-resp = requests.get(URL, headers={"User-Agent": "Mozilla/5.0 (academic project scraper)"}, timeout=30)
+            # skip empties, tiny junk tokens, and repeats
+            if t and t not in _JUNK and t not in seen:
+                seen.add(t)
+                out.append(t)
+    return out
+
+resp = http_client.SESSION.get(URL, timeout=30)
 resp.raise_for_status()
 soup = BeautifulSoup(resp.text, "lxml")
 
@@ -70,8 +71,7 @@ data = {
 print("Captured sections:", {k: len(v) for k, v in sections.items()})
 print("Captured subsections:", {k: len(v) for k, v in subsections.items()})
 
-with open("iit_mies_grad_tuition_fees.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+jsonio.dump(data, "iit_mies_grad_tuition_fees.json")
 
 print("Saved: iit_mies_grad_tuition_fees.json")
 
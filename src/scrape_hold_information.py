@@ -1,24 +1,37 @@
-import json
 import re
+from io import StringIO
+
 import pandas as pd
 
+import http_client
+import jsonio
+
 URL = "https://www.iit.edu/registrar/registration/hold-information"
 
+# Compiled once; clean_text runs on every cell of every table row
+_WS_RE = re.compile(r"\s+")
+_OR_RE = re.compile(r"\bOR\b")
+
 def clean_text(s: str) -> str:
-    s = re.sub(r"\s+", " ", str(s)).strip()
+    s = _WS_RE.sub(" ", str(s)).strip()
     # remove weird non-breaking spaces etc.
     s = s.replace("\xa0", " ")
     return s
 
-def to_bool_checkmark(cell: str) -> bool:
-    # IIT table sometimes renders ✓ or blank
-    c = clean_text(cell)
-    return "✓" in c
+# Some rows have "OR ..." in office/contact; keep as a list
+def split_or(s: str):
+    parts = [p.strip(" ,") for p in _OR_RE.split(s) if p.strip()]
+    return parts if len(parts) > 1 else [s] if s else []
 
-# Pull all HTML tables from the page
-tables = pd.read_html(URL)
+# Fetch through the shared pooled session (pd.read_html(URL) would
+# issue its own GET), then let pandas parse only tables mentioning
+# "Hold" instead of every table on the page. The match keyword stays a
+# single word because lxml's re:test doesn't honor \s across the
+# whitespace variants the header can render with.
+html = http_client.SESSION.get(URL, timeout=30).text
+tables = pd.read_html(StringIO(html), match="Hold", flavor="lxml")
 
-# Find the table that contains "Hold Description"
+# Confirm which candidate is the hold table via its normalized header
 target = None
 for df in tables:
     cols = [clean_text(c).lower() for c in df.columns]
@@ -36,34 +49,24 @@ target.columns = [clean_text(c) for c in target.columns]
 # Hold Description | Registration Prohibited | Transcript Withheld | Responsible Office/Originator | Contact Information
 # Some versions may merge office+contact; we handle both.
 
-rows = []
-for _, r in target.iterrows():
-    row = {k: clean_text(v) for k, v in r.to_dict().items()}
-
-    hold_desc = row.get("Hold Description", "")
-    reg_prohib = row.get("Registration Prohibited", "")
-    transcript = row.get("Transcript Withheld", "")
-    office = row.get("Responsible Office/Originator", "")
-    contact = row.get("Contact Information", "")
-
-    # If the site merged office+contact into one column, fall back
-    if not office and "Responsible" not in " ".join(target.columns):
-        # try best-effort: any extra columns
-        pass
-
-    # Some rows have "OR ..." in office/contact; keep as a list
-    def split_or(s: str):
-        parts = [p.strip(" ,") for p in re.split(r"\bOR\b", s) if p.strip()]
-        return parts if len(parts) > 1 else [s] if s else []
-
-    rows.append({
-        "hold_description": hold_desc,
-        "registration_prohibited": to_bool_checkmark(reg_prohib),
-        "transcript_withheld": to_bool_checkmark(transcript),
-        "responsible_office": split_or(office),
-        "contact_info": split_or(contact),
-        "source_url": URL
-    })
+def col(name):
+    # missing columns behave like empty strings, as row.get used to
+    if name in target.columns:
+        return target[name].map(clean_text)
+    return pd.Series("", index=target.index)
+
+# Column-wise transforms replace the old per-row iterrows loop
+records = pd.DataFrame({
+    "hold_description": col("Hold Description"),
+    # IIT table sometimes renders ✓ or blank
+    "registration_prohibited": col("Registration Prohibited").str.contains("✓", regex=False).map(bool),
+    "transcript_withheld": col("Transcript Withheld").str.contains("✓", regex=False).map(bool),
+    "responsible_office": col("Responsible Office/Originator").map(split_or),
+    "contact_info": col("Contact Information").map(split_or),
+})
+records["source_url"] = URL
+
+rows = records.to_dict(orient="records")
 
 out = {
     "source_url": URL,
@@ -73,8 +76,7 @@ out = {
 print("Hold records extracted:", len(rows))
 print("Sample:", rows[:3])
 
-with open("iit_hold_information.json", "w", encoding="utf-8") as f:
-    json.dump(out, f, ensure_ascii=False, indent=2)
+jsonio.dump(out, "iit_hold_information.json")
 
 print("Saved: iit_hold_information.json")
 
@@ -1,20 +1,25 @@
 import re
-import json
-import requests
 from bs4 import BeautifulSoup
 
+import http_client
+import jsonio
+
 URL = "https://www.iit.edu/registrar/people"
 
+# Compiled once; norm/is_phone run on every element after the staff header
+_WS_RE = re.compile(r"\s+")
+_PHONE_RE = re.compile(r"\d{3}\.\d{3}\.\d{4}")
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 def is_phone(s: str) -> bool:
-    return bool(re.fullmatch(r"\d{3}\.\d{3}\.\d{4}", s))
+    return bool(_PHONE_RE.fullmatch(s))
 
 def is_email(s: str) -> bool:
     return "@" in s and "." in s and " " not in s
 
-resp = requests.get(URL, headers={"User-Agent": "Mozilla/5.0 (academic project scraper)"}, timeout=30)
+resp = http_client.SESSION.get(URL, timeout=30)
 resp.raise_for_status()
 soup = BeautifulSoup(resp.text, "lxml")
 
@@ -30,32 +35,50 @@ for h2 in main.find_all("h2"):
 if not section_h2:
     raise RuntimeError("Couldn't find the staff section header. Page structure may have changed.")
 
-people = []
+# Structure-of-arrays accumulator: one parallel list per field, so no
+# per-person dict (and its repeated keys) survives past the walk. The
+# per-record source_url the old dicts carried is the top-level one.
+FIELDS = ["name", "title", "bio", "phone", "email"]
+people = {f: [] for f in FIELDS}
+
+def push(person):
+    for f in FIELDS:
+        people[f].append(person[f])
+
 current = None
 
 # After the staff header, each person starts at an h3 with their name.
-for el in section_h2.find_all_next():
+# Filtering the walk to the four tag names we classify skips the long
+# tail of spans/links/text nodes the old bare find_all_next() visited,
+# and each element's text is extracted and normalized exactly once per
+# iteration before feeding every classifier below.
+for el in section_h2.find_all_next(["h2", "h3", "p", "div"]):
     # Stop if we reach a new major section
-    if el.name == "h2" and el is not section_h2:
+    if el.name == "h2":
         break
 
     if el.name == "h3":
         # start a new person
         if current:
-            people.append(current)
+            push(current)
         current = {
             "name": norm(el.get_text(" ", strip=True)),
             "title": None,
             "bio": None,
             "phone": None,
-            "email": None,
-            "source_url": URL
+            "email": None
         }
         continue
 
     if not current:
         continue
 
+    # All fields filled: skip the text extraction entirely until the
+    # next person's h3 comes around
+    if not (current["title"] is None or current["bio"] is None
+            or current["phone"] is None or current["email"] is None):
+        continue
+
     text = norm(el.get_text(" ", strip=True))
     if not text:
         continue
@@ -81,20 +104,20 @@ for el in section_h2.find_all_next():
 
 # append last person
 if current:
-    people.append(current)
+    push(current)
 
 out = {
     "source_url": URL,
     "page_title": norm((main.find("h1") or soup.find("title")).get_text(" ", strip=True)),
-    "people": people
+    "fields": FIELDS,
+    "rows": people
 }
 
-print("People extracted:", len(people))
-for p in people:
-    print("-", p["name"], "|", p["title"])
+print("People extracted:", len(people["name"]))
+for name, title in zip(people["name"], people["title"]):
+    print("-", name, "|", title)
 
-with open("iit_registrar_people.json", "w", encoding="utf-8") as f:
-    json.dump(out, f, ensure_ascii=False, indent=2)
+jsonio.dump(out, "iit_registrar_people.json")
 
 print("Saved: iit_registrar_people.json")
 
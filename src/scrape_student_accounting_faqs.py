@@ -1,21 +1,72 @@
 # Student Accounting
-import requests
-from bs4 import BeautifulSoup
-import json
+from bs4 import BeautifulSoup, SoupStrainer
+from itertools import zip_longest
+from soupsieve import compile as sv_compile
+import os
 import re
 import time
 from typing import List, Dict, Any
 
+import http_client
+import jsonio
+
 URL = "https://www.iit.edu/student-accounting/faqs"
 
+# Everything the parse below touches lives under these tags (the meta
+# description and h1 directly; breadcrumbs, sidebar, and the FAQ
+# headings with their sibling content inside ol/nav/main/div), so the
+# parser can drop scripts, styles and the rest of the page chrome at
+# parse time
+_PAGE_STRAINER = SoupStrainer(["h1", "meta", "ol", "nav", "main", "div"])
+
+# Compiled once: clean_text runs for every text node on the page, and
+# the section matcher was rebuilt on each call
+_WS_RE = re.compile(r"\s+")
+_WITHDRAW_RE = re.compile("Withdrawing from VS. Dropping", re.I)
+# Parenthesized size annotation next to a file link, e.g. "(1.2 MB)"
+_SIZE_RE = re.compile(r"\([\d.,]+\s*[KMG]?B\)", re.I)
+
+# nbsp \u2192 space, zero-width space dropped; one C-level translate pass
+# instead of two .replace scans
+_TRANS = str.maketrans({"\xa0": " ", "\u200b": None})
+
+# Attachment extensions; one splitext + set lookup per anchor instead
+# of a five-suffix endswith over a fresh lowercased copy
+_DOC_EXTS = frozenset({'.pdf', '.doc', '.docx', '.xls', '.xlsx'})
+
+# Nav lookups compiled once at import; soupsieve matches each in one
+# traversal instead of a find for the container plus a find_all inside
+_SIDEBAR_LINKS = sv_compile("nav.sidebar-menu a[href]")
+_BREADCRUMB_ITEMS = sv_compile("ol.breadcrumbs li")
+
+
 def clean_text(s: str) -> str:
     """Clean and normalize text"""
     if not s:
         return ""
-    s = re.sub(r"\s+", " ", str(s)).strip()
-    s = s.replace("\xa0", " ")
-    s = s.replace("\u200b", "")  # Zero-width space
-    return s
+    if not isinstance(s, str):
+        s = str(s)
+    # Fast path: most strings from well-formed HTML are already single-
+    # spaced with no specials, so a few C-level containment checks skip
+    # the translate + regex work entirely
+    if ("\xa0" not in s and "\u200b" not in s and "  " not in s
+            and "\n" not in s and "\t" not in s and "\r" not in s):
+        return s.strip()
+    return _WS_RE.sub(" ", s.translate(_TRANS)).strip()
+
+
+def node_text(elem) -> str:
+    """Clean text straight off a tag
+
+    get_text with a separator and strip=True does the per-node
+    whitespace handling inside bs4's C-assisted walk, so the regex only
+    runs when the separator left double spaces behind (e.g. around
+    stripped-empty children).
+    """
+    text = elem.get_text(" ", strip=True).translate(_TRANS)
+    if "  " in text:
+        text = _WS_RE.sub(" ", text)
+    return text.strip()
 
 def extract_links_from_element(element) -> List[Dict[str, str]]:
     """Extract all links from an element"""
@@ -25,7 +76,7 @@ def extract_links_from_element(element) -> List[Dict[str, str]]:
     
     for a in element.find_all('a', href=True):
         href = a.get('href', '')
-        text = clean_text(a.get_text())
+        text = node_text(a)
         if text and href and not href.startswith('#'):
             # Make relative URLs absolute
             if href.startswith('/'):
@@ -48,39 +99,45 @@ def extract_files_from_element(element) -> List[Dict[str, Any]]:
         file_link = file_span.find('a')
         if file_link:
             href = file_link.get('href', '')
-            text = clean_text(file_link.get_text())
+            text = node_text(file_link)
             if href.startswith('/'):
                 href = f"https://www.iit.edu{href}"
             
-            # Try to get file size
-            file_size = None
-            size_text = file_span.find_next_sibling(string=True)
-            if size_text and '(' in size_text and ')' in size_text:
-                file_size = clean_text(size_text)
+            # Try to get file size: one regex scan over the parent's
+            # text instead of walking sibling strings and checking for
+            # parens (which also accepted non-size parentheticals)
+            parent = file_span.parent
+            match = _SIZE_RE.search(parent.get_text(" ")) if parent else None
+            file_size = match.group(0) if match else None
             
             files.append({
                 "name": text,
                 "url": href,
                 "size": file_size,
-                "type": "pdf" if href.lower().endswith('.pdf') else "document"
+                "type": "pdf" if os.path.splitext(href)[1].lower() == '.pdf' else "document"
             })
     
-    # Also look for any direct file links
+    # Also look for any direct file links; a set of the URLs collected
+    # so far replaces the linear any() scan per anchor
+    seen_urls = {f['url'] for f in files}
     for a in element.find_all('a', href=True):
         href = a.get('href', '')
-        if href.lower().endswith(('.pdf', '.doc', '.docx', '.xls', '.xlsx')):
-            # Check if we already added this file
-            if not any(f['url'] == href for f in files):
-                text = clean_text(a.get_text())
-                if href.startswith('/'):
-                    href = f"https://www.iit.edu{href}"
-                files.append({
-                    "name": text,
-                    "url": href,
-                    "size": None,
-                    "type": href.split('.')[-1].lower()
-                })
-    
+        ext = os.path.splitext(href)[1].lower()
+        if ext in _DOC_EXTS:
+            text = node_text(a)
+            if href.startswith('/'):
+                href = f"https://www.iit.edu{href}"
+            # Skip files already found via their file span
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+            files.append({
+                "name": text,
+                "url": href,
+                "size": None,
+                "type": ext[1:]
+            })
+
     return files
 
 def extract_table_data(table) -> Dict[str, Any]:
@@ -95,20 +152,21 @@ def extract_table_data(table) -> Dict[str, Any]:
         header_row = thead.find('tr')
         if header_row:
             for th in header_row.find_all('th'):
-                headers.append(clean_text(th.get_text()))
+                headers.append(node_text(th))
     
-    # Get rows
+    # Get rows: one dict comprehension per row, zip_longest supplying
+    # column_<i> keys for cells beyond the header count (None-padded
+    # headers for missing cells are filtered out)
     rows = []
     tbody = table.find('tbody')
     if tbody:
         for tr in tbody.find_all('tr'):
-            row_data = {}
             cells = tr.find_all(['td', 'th'])
-            for i, cell in enumerate(cells):
-                if i < len(headers):
-                    row_data[headers[i]] = clean_text(cell.get_text())
-                else:
-                    row_data[f"column_{i}"] = clean_text(cell.get_text())
+            row_data = {
+                header if header is not None else f"column_{i}": node_text(cell)
+                for i, (header, cell) in enumerate(zip_longest(headers, cells))
+                if cell is not None
+            }
             if row_data:
                 rows.append(row_data)
     
@@ -126,7 +184,7 @@ def parse_faq_sections(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     h3_headings = soup.find_all('h3')
     
     for heading in h3_headings:
-        question = clean_text(heading.get_text())
+        question = node_text(heading)
         if not question or "Withdrawing from VS. Dropping" in question:
             continue
         
@@ -136,39 +194,43 @@ def parse_faq_sections(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         files = []
         tables = []
         
-        next_elem = heading.find_next_sibling()
-        while next_elem and next_elem.name != 'h3':
-            if next_elem.name in ['p', 'div', 'ol', 'ul']:
+        # One walk over the sibling chain instead of a find_next_sibling
+        # call per step; text nodes between tags are skipped inline
+        for next_elem in heading.next_siblings:
+            name = getattr(next_elem, 'name', None)
+            if name is None:
+                continue
+            if name == 'h3':
+                break
+            if name in ('p', 'div', 'ol', 'ul'):
                 # Handle subheadings (h6)
-                if next_elem.name == 'div' and next_elem.find('h6'):
+                if name == 'div':
                     subheading = next_elem.find('h6')
                     if subheading:
-                        content_paragraphs.append(f"[{clean_text(subheading.get_text())}]")
-                
+                        content_paragraphs.append(f"[{node_text(subheading)}]")
+
                 # Extract text
-                text = clean_text(next_elem.get_text())
+                text = node_text(next_elem)
                 if text and len(text) > 5:
                     content_paragraphs.append(text)
-                
+
                 # Extract links
                 links.extend(extract_links_from_element(next_elem))
-                
+
                 # Extract files
                 files.extend(extract_files_from_element(next_elem))
-            
-            # Extract tables
-            if next_elem.name == 'div' and next_elem.find('table'):
-                table = next_elem.find('table')
+
+            # Extract tables (one find instead of the check-then-fetch pair)
+            if name == 'div' and (table := next_elem.find('table')) is not None:
                 table_data = extract_table_data(table)
                 if table_data:
                     tables.append(table_data)
-            
-            next_elem = next_elem.find_next_sibling()
         
         if content_paragraphs:
+            # Only the joined text is stored; answer_paragraphs
+            # duplicated it piecewise and nothing downstream read it
             faqs.append({
                 "question": question,
-                "answer_paragraphs": content_paragraphs,
                 "full_answer": " ".join(content_paragraphs),
                 "links": links,
                 "files": files,
@@ -180,25 +242,27 @@ def parse_faq_sections(soup: BeautifulSoup) -> List[Dict[str, Any]]:
 def extract_withdraw_vs_drop_table(soup: BeautifulSoup) -> Dict[str, Any]:
     """Extract the specific Withdraw vs Drop comparison table"""
     # Find the h3 heading for this section
-    heading = soup.find('h3', string=re.compile("Withdrawing from VS. Dropping", re.I))
+    heading = soup.find('h3', string=_WITHDRAW_RE)
     if not heading:
         return None
     
-    # Get the description paragraph
+    # One walk over the sibling chain: the first tag may be the
+    # description paragraph, and the first div holding a table ends the
+    # search (one find instead of the check-then-fetch pair)
     description = None
-    next_elem = heading.find_next_sibling()
-    if next_elem and next_elem.name == 'p':
-        description = clean_text(next_elem.get_text())
-    
-    # Find the table
     table_elem = None
-    current = heading
-    while current and not table_elem:
-        current = current.find_next_sibling()
-        if current and current.name == 'div' and current.find('table'):
-            table_elem = current.find('table')
+    first_tag = True
+    for sib in heading.next_siblings:
+        name = getattr(sib, 'name', None)
+        if name is None:
+            continue
+        if first_tag:
+            if name == 'p':
+                description = node_text(sib)
+            first_tag = False
+        if name == 'div' and (table_elem := sib.find('table')) is not None:
             break
-    
+
     if not table_elem:
         return None
     
@@ -210,42 +274,21 @@ def extract_withdraw_vs_drop_table(soup: BeautifulSoup) -> Dict[str, Any]:
         "table": table_data
     }
 
-def extract_contact_info(soup: BeautifulSoup) -> Dict[str, Any]:
-    """Extract contact information for Student Accounting"""
-    contact_info = {
-        "email": None,
-        "phone": None,
-        "office": "Student Accounting Office"
-    }
-    
-    # Look for email in the page
-    email_links = soup.find_all('a', href=re.compile(r'mailto:sa@'))
-    for link in email_links:
-        href = link.get('href', '')
-        if 'sa@illinoistech.edu' in href:
-            contact_info["email"] = "sa@illinoistech.edu"
-            break
-    
-    return contact_info
-
 def extract_sidebar_navigation(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     """Extract sidebar navigation links"""
     sidebar_links = []
-    sidebar = soup.find('nav', class_='sidebar-menu')
-    
-    if sidebar:
-        for a in sidebar.find_all('a', href=True):
-            href = a.get('href', '')
-            text = clean_text(a.get_text())
-            if text and href:
-                if href.startswith('/'):
-                    href = f"https://www.iit.edu{href}"
-                sidebar_links.append({
-                    "text": text,
-                    "url": href,
-                    "is_active": 'is-active' in a.get('class', [])
-                })
-    
+    for a in _SIDEBAR_LINKS.select(soup):
+        href = a.get('href', '')
+        text = node_text(a)
+        if text and href:
+            if href.startswith('/'):
+                href = f"https://www.iit.edu{href}"
+            sidebar_links.append({
+                "text": text,
+                "url": href,
+                "is_active": 'is-active' in a.get('class', [])
+            })
+
     return sidebar_links
 
 def scrape_student_accounting_faqs():
@@ -256,23 +299,26 @@ def scrape_student_accounting_faqs():
     print(f"URL: {URL}")
     print("-" * 70)
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(URL, headers=headers, timeout=30)
+        # Shared pooled session with conditional-GET revalidation: an
+        # unchanged page answers 304 with no body and the cached bytes
+        # are reused
+        response = http_client.get_cached(URL, timeout=30)
         response.raise_for_status()
         print("✓ Page loaded successfully")
     except Exception as e:
         print(f"✗ Error loading page: {e}")
         return None
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # lxml's C parser is several times faster than the pure-Python
+    # html.parser and builds a leaner tree. Handing it the raw bytes
+    # lets it sniff the charset and decode in C, so the page body never
+    # gets a second str copy on the Python heap via response.text
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=_PAGE_STRAINER)
     
     # Extract page metadata
     title_elem = soup.find('h1')
-    page_title = clean_text(title_elem.get_text() if title_elem else "Student Accounting FAQs")
+    page_title = node_text(title_elem) if title_elem else "Student Accounting FAQs"
     
     # Extract meta description
     meta_desc = soup.find('meta', attrs={'name': 'description'})
@@ -280,24 +326,27 @@ def scrape_student_accounting_faqs():
     
     # Extract breadcrumbs
     breadcrumbs = []
-    breadcrumb_list = soup.find('ol', class_='breadcrumbs')
-    if breadcrumb_list:
-        for li in breadcrumb_list.find_all('li'):
-            link = li.find('a')
-            if link:
-                breadcrumbs.append({
-                    "name": clean_text(link.get_text()),
-                    "url": f"https://www.iit.edu{link.get('href', '')}"
-                })
-            else:
-                breadcrumbs.append({"name": clean_text(li.get_text()), "url": None})
+    for li in _BREADCRUMB_ITEMS.select(soup):
+        link = li.find('a')
+        if link:
+            breadcrumbs.append({
+                "name": node_text(link),
+                "url": f"https://www.iit.edu{link.get('href', '')}"
+            })
+        else:
+            breadcrumbs.append({"name": node_text(li), "url": None})
     
     # Extract sidebar navigation
     sidebar_navigation = extract_sidebar_navigation(soup)
     
-    # Extract contact information
-    contact_info = extract_contact_info(soup)
-    
+    # Contact information; the email is spotted during the anchor pass
+    # below instead of a dedicated find_all over the page
+    contact_info = {
+        "email": None,
+        "phone": None,
+        "office": "Student Accounting Office"
+    }
+
     # Extract the special Withdraw vs Drop table
     withdraw_vs_drop = extract_withdraw_vs_drop_table(soup)
     if withdraw_vs_drop:
@@ -307,27 +356,34 @@ def scrape_student_accounting_faqs():
     faqs = parse_faq_sections(soup)
     print(f"  ✓ Found {len(faqs)} FAQ topics")
     
-    # Extract all links from the page for reference
-    all_links = []
+    # One anchor pass serves both the reference link list and the
+    # contact email, deduplicating by URL as it goes (first occurrence
+    # wins) instead of building the full list and filtering it in a
+    # second pass
+    unique_links = []
+    seen_urls = set()
     for a in soup.find_all('a', href=True):
         href = a.get('href', '')
-        text = clean_text(a.get_text())
-        if text and href and not href.startswith('#') and not href.startswith('javascript:'):
-            if href.startswith('/'):
-                href = f"https://www.iit.edu{href}"
-            all_links.append({
+        if contact_info["email"] is None and 'mailto:sa@' in href and 'sa@illinoistech.edu' in href:
+            contact_info["email"] = "sa@illinoistech.edu"
+        if href.startswith('/'):
+            href = f"https://www.iit.edu{href}"
+        if href in seen_urls or href.startswith(('#', 'javascript:')):
+            continue
+        # Only the first 50 unique links are kept; once the email has
+        # also turned up there's nothing left to collect
+        if len(unique_links) == 50:
+            if contact_info["email"] is not None:
+                break
+            continue
+        text = node_text(a)
+        if text and href:
+            seen_urls.add(href)
+            unique_links.append({
                 "text": text,
                 "url": href
             })
     
-    # Remove duplicate links
-    unique_links = []
-    seen_urls = set()
-    for link in all_links:
-        if link['url'] not in seen_urls:
-            seen_urls.add(link['url'])
-            unique_links.append(link)
-    
     # Compile complete webpage data
     output_data = {
         "url": URL,
@@ -340,13 +396,12 @@ def scrape_student_accounting_faqs():
         "withdraw_vs_drop": withdraw_vs_drop,
         "total_faqs": len(faqs),
         "faqs": faqs,
-        "all_page_links": unique_links[:50]  # Limit to first 50 to keep file size reasonable
+        "all_page_links": unique_links  # Capped at 50 to keep file size reasonable
     }
     
     # Save to JSON following team naming convention
     filename = "iit_student_accounting_faqs.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    jsonio.dump(output_data, filename)
     
     print(f"\n{'=' * 70}")
     print("Scraping Complete!")
@@ -355,7 +410,8 @@ def scrape_student_accounting_faqs():
     print(f"✓ Total FAQ topics: {len(faqs)}")
     if withdraw_vs_drop:
         print(f"✓ Withdraw vs Drop comparison table extracted")
-    print(f"✓ File size: {len(json.dumps(output_data)) / 1024:.1f} KB")
+    # Size of the file just written; no second serialization pass
+    print(f"✓ File size: {os.path.getsize(filename) / 1024:.1f} KB")
     
     return output_data
 
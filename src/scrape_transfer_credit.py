@@ -1,27 +1,28 @@
-import requests
 from bs4 import BeautifulSoup
-import json
 import time
 import re
 
+import http_client
+import jsonio
+
 URL = "https://catalog.iit.edu/graduate/academic-policies-procedures/academic-progress/transfer-credit/"
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-}
+# Compiled once; clean_text runs on every heading, paragraph, and list item
+_WS_RE = re.compile(r"\s+")
 
 def clean_text(text):
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 def scrape_transfer_credit():
-    response = requests.get(URL, headers=HEADERS, timeout=10)
+    response = http_client.SESSION.get(URL, timeout=10)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    # lxml's C parser is several times faster than the pure-Python
+    # html.parser; passing bytes lets it sniff the encoding itself
+    soup = BeautifulSoup(response.content, "lxml")
 
     main_content = soup.find("div", id="content")
     text_container = main_content.find("div", id="textcontainer")
@@ -76,8 +77,7 @@ def scrape_transfer_credit():
 if __name__ == "__main__":
     data = scrape_transfer_credit()
 
-    with open("transfer_credit.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    jsonio.dump(data, "transfer_credit.json")
 
     print("✓ Transfer Credit data scraped successfully")
     print(f"✓ Sections extracted: {len(data['sections'])}")
@@ -1,41 +1,43 @@
 import re
-import json
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+
+import http_client
+import jsonio
 
 URL = "https://www.iit.edu/student-accounting/tuition-and-fees/future-tuition-and-fees/mies-campus-undergraduate"
 
+# Compiled once; these run on every text node the walks visit
+_WS_RE = re.compile(r"\s+")
+
+# Junk tokens the walks always skip
+_JUNK = {"»", "|"}
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 def collect_text_until_next_h2(h2_tag):
-    """Collect plain text nodes after this h2 until the next h2."""
+    """Collect plain text nodes after this h2 until the next h2.
+
+    Dedup happens in the same pass, so the walk's text is never
+    buffered twice.
+    """
+    seen = set()
     out = []
     for el in h2_tag.next_elements:
         # Stop when we hit the next section header
         if getattr(el, "name", None) == "h2":
             break
 
-        # Grab raw text nodes (this is what your previous version missed)
-        if isinstance(el, str):
+        # NavigableString check short-circuits on Tags faster than str
+        if isinstance(el, NavigableString):
             t = norm(el)
-            if not t:
-                continue
-            # Filter obvious junk
-            if t in {"»", "|"}:
-                continue
-            out.append(t)
-
-    # De-dup while preserving order
-    seen = set()
-    cleaned = []
-    for x in out:
-        if x not in seen:
-            seen.add(x)
-            cleaned.append(x)
-    return cleaned
-
-resp = requests.get(URL, headers={"User-Agent": "Mozilla/5.0 (academic project scraper)"}, timeout=30)
+            # skip empties, obvious junk tokens, and repeats
+            if t and t not in _JUNK and t not in seen:
+                seen.add(t)
+                out.append(t)
+    return out
+
+resp = http_client.SESSION.get(URL, timeout=30)
 resp.raise_for_status()
 soup = BeautifulSoup(resp.text, "lxml")
 
@@ -60,8 +62,7 @@ for k, v in sections.items():
     print(f"- {k}: {len(v)} text items")
     print("  sample:", v[:8])
 
-with open("iit_mies_ug_tuition_fees.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+jsonio.dump(data, "iit_mies_ug_tuition_fees.json")
 
 print("Saved: iit_mies_ug_tuition_fees.json")
 
@@ -1,80 +1,90 @@
-import requests
-from bs4 import BeautifulSoup
-import json
+from selectolax.lexbor import LexborHTMLParser
 import time
 
+import http_client
+import jsonio
+
 URL = "https://www.iit.edu/commencement"
 
-headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-}
+# Hashed membership tests for the hot dispatch loop, built once
+_HEADINGS = frozenset(('h1', 'h2', 'h3'))
+_LISTS = frozenset(('ul', 'ol'))
 
 def scrape_commencement(url):
     print(f"Scraping: {url}")
-    response = requests.get(url, headers=headers, timeout=10)
+    # Conditional GET against the shared disk cache: re-runs against an
+    # unchanged page revalidate with ETag/Last-Modified and reuse the
+    # cached body instead of re-downloading
+    response = http_client.get_cached(url, timeout=10)
     if response.status_code != 200:
         print(f"Error: Status code {response.status_code}")
         return None
 
-    soup = BeautifulSoup(response.content, 'html.parser')
+    # Lexbor (via selectolax) parses the page in C, the same engine
+    # Directory.py uses; one CSS query then yields exactly the content
+    # tags in document order, so the Python loop never touches the
+    # rest of the tree
+    tree = LexborHTMLParser(response.content)
+    main_content = tree.css_first('main') or tree.body or tree.root
 
     sections = []
-    current_section = {"title": "Overview", "paragraphs": [], "lists": [], "links": [], "full_text": ""}
 
-    main_content = soup.find('main') or soup.find('body')
-    if not main_content:
-        main_content = soup
+    def new_section(title):
+        # full_text is buffered as a list of parts and joined once when
+        # the section closes, instead of growing a string per tag
+        return {"title": title, "paragraphs": [], "lists": [], "links": [], "full_text_parts": []}
+
+    def close_section(section):
+        """Join the buffered text and keep the section if it has content"""
+        if section["paragraphs"] or section["lists"] or section["full_text_parts"]:
+            parts = section.pop("full_text_parts")
+            section["full_text"] = "\n".join(parts) + "\n" if parts else ""
+            sections.append(section)
+
+    current_section = new_section("Overview")
 
-    for tag in main_content.descendants:
-        if not getattr(tag, 'name', None):
-            continue
+    for tag in main_content.css('h1, h2, h3, p, ul, ol, a[href]'):
+        name = tag.tag
 
         # Headings
-        if tag.name in ['h1', 'h2', 'h3']:
-            if current_section["paragraphs"] or current_section["lists"] or current_section["full_text"]:
-                sections.append(current_section)
-
-            current_section = {
-                "title": tag.get_text(strip=True),
-                "paragraphs": [],
-                "lists": [],
-                "links": [],
-                "full_text": ""
-            }
+        if name in _HEADINGS:
+            close_section(current_section)
+            current_section = new_section(tag.text(strip=True))
 
         # Paragraphs
-        elif tag.name == 'p':
-            text = tag.get_text(strip=True)
+        elif name == 'p':
+            text = tag.text(strip=True)
             if text:
                 current_section["paragraphs"].append(text)
-                current_section["full_text"] += text + "\n"
+                current_section["full_text_parts"].append(text)
 
         # Lists
-        elif tag.name in ['ul', 'ol']:
-            items = [li.get_text(strip=True) for li in tag.find_all('li') if li.get_text(strip=True)]
+        elif name in _LISTS:
+            items = [text for li in tag.css('li') if (text := li.text(strip=True))]
             if items:
                 current_section["lists"].append({
-                    "type": tag.name,
+                    "type": name,
                     "items": items
                 })
-                current_section["full_text"] += "\n".join(items) + "\n"
+                current_section["full_text_parts"].append("\n".join(items))
 
         # Links
-        elif tag.name == 'a' and tag.get('href'):
-            href = tag['href']
+        else:
+            href = tag.attributes.get('href')
+            if not href:
+                continue
             if href.startswith('/'):
                 href = 'https://www.iit.edu' + href
-            link_text = tag.get_text(strip=True)
+            link_text = tag.text(strip=True)
             current_section["links"].append({
                 "text": link_text,
                 "url": href
             })
             if link_text:
-                current_section["full_text"] += link_text + "\n"
+                current_section["full_text_parts"].append(link_text)
 
     # Add last section
-    if current_section["paragraphs"] or current_section["lists"] or current_section["full_text"]:
-        sections.append(current_section)
+    close_section(current_section)
 
     return sections
 
@@ -93,7 +103,6 @@ output = {
 
 # Save JSON
 json_file = "iit_commencement.json"
-with open(json_file, 'w', encoding='utf-8') as f:
-    json.dump(output, f, indent=2, ensure_ascii=False)
+jsonio.dump(output, json_file)
 
 print(f"✓ Saved structured JSON to {json_file}")
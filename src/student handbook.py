@@ -1,53 +1,55 @@
 
 
+import concurrent.futures
+import os
+
 import pdfplumber
-import json
+import pymupdf
+
+import jsonio
 
 pdf_path = "C:/Users/visma/Downloads/25-26_StudentHandbook_Final_Aug15.pdf"
 
-print("Opening PDF and extracting data...")
-with pdfplumber.open(pdf_path) as pdf:
-    
+
+def extract_page_tables(args):
+    """Extract one page's tables in a worker process."""
+    path, i = args
+    with pdfplumber.open(path) as pdf:
+        return i + 1, pdf.pages[i].extract_tables()
+
+
+if __name__ == "__main__":
+    print("Opening PDF and extracting data...")
+    doc = pymupdf.open(pdf_path)
+
     # Get PDF info
     pdf_info = {
-        'total_pages': len(pdf.pages),
-        'metadata': pdf.metadata
+        'total_pages': doc.page_count,
+        'metadata': doc.metadata
     }
     print(f"Total Pages: {pdf_info['total_pages']}")
-    
-    # Extract all text from all pages
-    print("Extracting text from all pages...")
-    text_data = []
-    for i, page in enumerate(pdf.pages, start=1):
-        text = page.extract_text()
-        text_data.append({
-            'page_number': i,
-            'text': text
-        })
-    
-    # Extract all tables
-    print("Extracting tables...")
-    tables_data = []
-    for i, page in enumerate(pdf.pages, start=1):
-        tables = page.extract_tables()
-        if tables:
-            for j, table in enumerate(tables, start=1):
-                tables_data.append({
-                    'page_number': i,
-                    'table_number': j,
-                    'data': table
-                })
-    
-    print(f"Found {len(tables_data)} tables")
-    
-    # Save everything to JSON
-    complete_data = {
-        'pdf_info': pdf_info,
-        'text_by_page': text_data,
-        'tables': tables_data
-    }
-    
-    with open('Student Handbook.json', 'w', encoding='utf-8') as f:
-        json.dump(complete_data, f, indent=2, ensure_ascii=False)
-    
-    print("\n✓ Complete! Data saved to extracted_data.json")
+    jsonio.dump(pdf_info, 'Student Handbook info.json')
+
+    # One record per page, written as it is produced: peak memory stays
+    # at a few in-flight pages instead of the whole extracted corpus
+    # plus its serialized dump. Text comes from MuPDF inline; tables
+    # stream back from the pdfplumber worker pool in page order.
+    print("Extracting text and tables from all pages...")
+    total_tables = 0
+    with open('Student Handbook pages.ndjson', 'wb') as out, \
+            concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        table_results = ex.map(extract_page_tables,
+                               [(pdf_path, i) for i in range(pdf_info['total_pages'])],
+                               chunksize=4)
+        for page, (page_number, tables) in zip(doc, table_results):
+            total_tables += len(tables)
+            out.write(jsonio.dumps_line({
+                'page_number': page_number,
+                'text': page.get_text("text"),
+                'tables': tables
+            }))
+            out.write(b'\n')
+    doc.close()
+
+    print(f"Found {total_tables} tables")
+    print("\n✓ Complete! Data saved to Student Handbook pages.ndjson")